@@ -33,6 +33,9 @@ setup(
     install_requires=[
         'pygame',
     ],
+    extras_require={
+        'numpy': ['numpy'],  # Optional: vectorized force kernels
+    },
     license='Apache License 2.0',
     keywords='AutoChess, Battler, Python, PyGame',
     classifiers=[
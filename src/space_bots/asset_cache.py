@@ -0,0 +1,90 @@
+"""AssetCache: Loads each image once and hands out shared handles (keyed by path and size)"""
+import os
+
+
+class AssetCache:
+    """AssetCache: Loads each image once and hands out shared handles (keyed by path and size)
+       Usage:
+            assets = AssetCache(game_engine.image_load)
+            assets.preload(['images/planet_brown.png'])    # Load/convert at startup (not mid-battle)
+            image = assets.image('images/planet_brown.png')  # Shared handle, don't draw ON it
+            print(assets.memory_report())
+       Note: Relative paths are relative to the space_bots package directory
+    """
+    base_dir = os.path.dirname(__file__)
+
+    def __init__(self, image_load):
+        """AssetCache Initialization
+           Args:
+               image_load: Function image_load(image_file, x_size, y_size) that returns a Surface (or stub)
+        """
+        self.image_load = image_load
+        self.images = {}
+        self.num_loads = 0
+
+    def path(self, image_file):
+        """Full path for the image file"""
+        return image_file if os.path.isabs(image_file) else os.path.join(self.base_dir, image_file)
+
+    def image(self, image_file, x_size=0, y_size=0, alpha=True):
+        """Get the image (loaded and converted for fast blits the first time it's asked for)
+           Args:
+               image_file: Path to the image file
+               x_size, y_size: Scale the image to this size (0 = as is)
+               alpha: convert_alpha() for images with transparency, otherwise convert()
+        """
+        key = (self.path(image_file), x_size, y_size, alpha)
+        image = self.images.get(key)
+        if image is None:
+            image = self.image_load(key[0], x_size, y_size)
+            image = image.convert_alpha() if alpha else image.convert()
+            self.images[key] = image
+            self.num_loads += 1
+        return image
+
+    def preload(self, image_files):
+        """Load the image files now (so the first frame that uses them doesn't hit the disk)"""
+        for image_file in image_files:
+            self.image(image_file)
+
+    def memory_footprint(self):
+        """Approximate number of bytes used by the cached images (width * height * bytes per pixel)"""
+        total = 0
+        for image in self.images.values():
+            width, height = image.get_size()
+            total += width * height * image.get_bytesize()
+        return total
+
+    def memory_report(self):
+        """One line summary of the cached images"""
+        return f'Assets: {len(self.images)} images {self.memory_footprint()/1024:.1f} KB'
+
+
+# Simple test of the AssetCache functionality
+def test():
+    """Test for AssetCache Class"""
+    from space_bots.headless_engine_adapter import HeadlessEngineAdapter
+
+    # Count the actual loads
+    loads = []
+
+    def image_load(image_file, x_size=0, y_size=0):
+        loads.append(image_file)
+        return HeadlessEngineAdapter.image_load(image_file, x_size, y_size)
+
+    # Images are loaded once and shared after that (a different size is a different asset)
+    assets = AssetCache(image_load)
+    assets.preload(['images/planet_brown.png'])
+    image = assets.image('images/planet_brown.png')
+    assert image is assets.image(os.path.join(AssetCache.base_dir, 'images/planet_brown.png'))
+    assert len(loads) == 1 and image.get_size() == (80, 80)
+    assert assets.image('images/planet_brown.png', 40, 40).get_size() == (40, 40)
+    assert assets.num_loads == len(loads) == 2
+
+    # Memory footprint
+    assert assets.memory_footprint() == (80 * 80 + 40 * 40) * 4
+    print(assets.memory_report())
+
+
+if __name__ == "__main__":
+    test()
@@ -1,5 +1,4 @@
 """Asteroid: Class for the Asteroids in Space Bots"""
-import os
 import math
 from random import randint, choice
 
@@ -27,9 +26,8 @@ class Asteroid(entity.Entity):
         # Call SuperClass (Entity) Initialization
         super().__init__(game_engine, x, y, mass=1000, collision_radius=self.collision_radius)
 
-        # Grab our asteroid image
-        image_path = os.path.join(os.path.dirname(__file__), 'images/planet_brown.png')
-        self.asteroid_image = game_engine.image_load(image_path)
+        # Grab our asteroid image (shared by all the asteroids)
+        self.asteroid_image = game_engine.get_image('images/planet_brown.png')
         self.img_width, self.img_height = self.asteroid_image.get_size()
         self.image_offset_x = self.img_width/2
         self.image_offset_y = self.img_height/2
@@ -41,20 +39,42 @@ class Asteroid(entity.Entity):
         self.force_y = randint(-200, 200)
         self.force_damp = 1.0
         self.mineral = mineral_colors[choice(list(mineral_colors.keys()))]
-        self.concentration = randint(1, minerals)
+        self._concentration = randint(1, minerals)
 
-        # Precompute mineral locations
+        # Precompute mineral locations (the layout is fixed, the concentration just sets how many are visible)
         self.mineral_locations = self.precompute_minerals()
 
+        # Pre-rendered composite (image + minerals + outline), only re-rendered when it's dirty
+        # Note: Changing the concentration (see the setter) is what makes it dirty
+        self.composite_size = max(self.img_width, self.img_height, 2 * self.radius)
+        self.composite = None
+        self.composite_dirty = True
+
+    @property
+    def concentration(self):
+        return self._concentration
+
+    @concentration.setter
+    def concentration(self, value):
+        """Re-render the composite if the visible minerals change"""
+        visible_minerals = self.visible_minerals()
+        self._concentration = value
+        if self.visible_minerals() != visible_minerals:
+            self.composite_dirty = True
+
     def extract_minerals(self, amount):
         """Extract Minerals from this Asteroid"""
         if self.concentration > amount:
             self.concentration -= amount
-            return amount
+            extracted_amount = amount
         else:
             extracted_amount = self.concentration
             self.concentration = 0
-            return extracted_amount
+        return extracted_amount
+
+    def visible_minerals(self):
+        """Number of minerals that get drawn"""
+        return int(self.concentration+.5)
 
     def precompute_minerals(self):
         """Precompute Mineral positions"""
@@ -90,23 +110,33 @@ class Asteroid(entity.Entity):
         self.move()
 
     def draw(self):
-        """Draw the entire Asteroid"""
-        self.draw_asteroid()
-        self.draw_minerals()
-        self.draw_outline()
-
-    def draw_asteroid(self):
+        """Draw the entire Asteroid (one blit of the pre-rendered composite)"""
+        if self.composite_dirty:
+            self.composite = self.game_engine.render_surface(self.composite_size, self.composite_size,
+                                                             self.render_composite)
+            self.composite_dirty = False
+        offset = self.composite_size / 2
+        self.game_engine.draw_image(self.composite, self.x - offset, self.y - offset)
+
+    def render_composite(self):
+        """Render the Asteroid Icon, minerals, and outline (centered on the composite surface)"""
+        center = (self.composite_size / 2, self.composite_size / 2)
+        self.draw_asteroid(center)
+        self.draw_minerals(center)
+        self.draw_outline(center)
+
+    def draw_asteroid(self, center):
         """Draw the Asteroid Icon"""
-        self.game_engine.draw_image(self.asteroid_image, self.image_x, self.image_y)
+        self.game_engine.draw_image(self.asteroid_image, center[0] - self.image_offset_x, center[1] - self.image_offset_y)
 
-    def draw_minerals(self):
+    def draw_minerals(self, center):
         """Draw the minerals for this asteroid"""
-        for pos in self.mineral_locations[:int(self.concentration+.5)]:
-            self.game_engine.draw_mineral(self.mineral, (self.x+pos[0], self.y+pos[1]), radius=5)
+        for pos in self.mineral_locations[:self.visible_minerals()]:
+            self.game_engine.draw_mineral(self.mineral, (center[0]+pos[0], center[1]+pos[1]), radius=5)
 
-    def draw_outline(self):
+    def draw_outline(self, center):
         """Draw the Asteroid Outline"""
-        self.game_engine.draw_circle((0, 0, 0), (self.x, self.y), self.radius-1, width=2)
+        self.game_engine.draw_circle((0, 0, 0), center, self.radius-1, width=2)
 
 
 # Simple test of the Asteroid functionality
@@ -128,6 +158,17 @@ def test():
     my_asteroid = Asteroid(my_game_engine, 200, 200)
     my_universe.add_asteroid(my_asteroid)
 
+    # Composites are only re-rendered when the visible minerals change
+    my_asteroid.draw()
+    assert not my_asteroid.composite_dirty and my_asteroid.composite.get_size() == (80, 80)
+    my_asteroid.concentration = 5
+    assert my_asteroid.composite_dirty
+    my_asteroid.draw()
+    my_asteroid.extract_minerals(0.2)
+    assert not my_asteroid.composite_dirty
+    my_asteroid.extract_minerals(1)
+    assert my_asteroid.composite_dirty
+
     # Invoke the event loop
     my_game_engine.event_loop()
 
@@ -0,0 +1,212 @@
+"""Batch: Run lots of seeded headless missions in parallel to check/tune mission balance
+
+   Usage:
+        python -m space_bots.batch mission_18 --runs 200 --workers 8 --output mission_18.json.gz
+"""
+import os
+import sys
+import gzip
+import json
+import math
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Local Imports
+from space_bots.universe import Universe
+from space_bots.headless_engine_adapter import HeadlessEngineAdapter
+
+# Default max length of a mission (in ticks), 3 minutes of simulation time at 120 ticks/second
+MAX_TICKS = 120 * 180
+
+
+def mission_level(mission):
+    """Mission can be given as 18, '18', or 'mission_18'"""
+    return int(str(mission).replace('mission_', ''))
+
+
+def team_alive(universe, team):
+    """Does the team have any ships left? (straight from the squads, not the per-tick BattleState caches)"""
+    return any(not ship.is_dead() for _squad in universe.squads if _squad.team == team for ship in _squad.ships)
+
+
+def run_mission(mission, seed, max_ticks=MAX_TICKS, quiet=True, mission_file=None):
+    """Run a single seeded headless mission (with the mission test squads) and return the outcome/stats
+       Args:
+           mission: The mission (e.g. 18 or 'mission_18')
+           seed: The random seed for this run
+           max_ticks: Give up (outcome='timeout') after this many ticks
+           quiet: Suppress all the printing the Universe does
+           mission_file: Optional spec file (all the missions or a single mission file)
+       Returns:
+           dict: outcome, win, ticks, survivors, total_zenite, total_damage, damage_done_<ship_type>...
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull if quiet else sys.stdout):
+        universe = Universe(announcements=False, seed=seed)
+        engine = HeadlessEngineAdapter(universe)
+        universe.set_game_engine(engine)
+        universe.mission_planner.set_mission(mission_level(mission), test_squads=True, mission_file=mission_file)
+
+        # Hold on to the earth squads/ships (squads and ships get removed from the Universe when they die)
+        earth_squads = [s for s in universe.squads if s.team == 'earth']
+        earth_ships = [ship for s in earth_squads for ship in s.ships]
+
+        # Run until the earth ships are all dead or the zerg are all dead (and no more are coming)
+        outcome = 'timeout'
+        ticks = 0
+        while ticks < max_ticks:
+            ticks += engine.run(1, draw_every=0)
+            if not team_alive(universe, 'earth'):
+                outcome = 'loss'
+                break
+            if not universe.mission_planner.events_remaining() and not team_alive(universe, 'zerg'):
+                outcome = 'win'
+                break
+
+    # Collect the stats for this run
+    stats = {'mission': f'mission_{mission_level(mission)}', 'seed': seed, 'outcome': outcome,
+             'win': outcome == 'win', 'ticks': ticks,
+             'survivors': sum(1 for s in earth_ships if not s.is_dead()),
+             'total_zenite': sum(s.total_zenite for s in earth_squads),
+             'total_damage': sum(s.total_damage for s in earth_squads)}
+    for ship in earth_ships:
+        key = f'damage_done_{ship.ship_type}'
+        stats[key] = stats.get(key, 0) + ship.damage_done
+    return stats
+
+
+def _run_mission_args(args):
+    """Internal: Process pool helper (unpacks the args tuple)"""
+    return run_mission(*args)
+
+
+def run_batch(mission, runs=100, workers=None, seed=0, max_ticks=MAX_TICKS, mission_file=None):
+    """Run N seeded headless missions across a process pool
+       Note: Each worker compiles (and holds) just this mission, once
+       Returns:
+           list: A stats dict for each run (in seed order)
+    """
+    job_args = [(mission, seed + n, max_ticks, True, mission_file) for n in range(runs)]
+    workers = workers or os.cpu_count()
+    chunk_size = max(1, runs // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_mission_args, job_args, chunksize=chunk_size))
+
+
+def to_columns(results):
+    """Convert a list of per-run stats dicts into columns (missing values are 0)"""
+    names = []
+    for stats in results:
+        names += [name for name in stats if name not in names]
+    return {name: [stats.get(name, 0) for stats in results] for name in names}
+
+
+def mean_confidence(values, z=1.96):
+    """Mean and the 95% confidence interval (normal approximation) for a list of values"""
+    n = len(values)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = sum(values) / n
+    if n < 2:
+        return mean, mean, mean
+    std_error = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1) / n)
+    return mean, mean - z * std_error, mean + z * std_error
+
+
+def wilson_interval(wins, n, z=1.96):
+    """Win rate and its 95% Wilson score interval"""
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    rate = wins / n
+    center = (rate + z * z / (2 * n)) / (1 + z * z / n)
+    spread = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / (1 + z * z / n)
+    return rate, center - spread, center + spread
+
+
+def aggregate(columns):
+    """Aggregate the per-run columns into (mean, low, high) for each stat"""
+    summary = {'runs': len(columns['seed'])}
+    summary['win_rate'] = wilson_interval(sum(columns['win']), summary['runs'])
+    for name, values in columns.items():
+        if name in ('mission', 'seed', 'outcome', 'win'):
+            continue
+        summary[name] = mean_confidence(values)
+    return summary
+
+
+def write_results(columns, file_path):
+    """Write the columns to a compact (gzipped, columnar JSON) results file"""
+    with gzip.open(file_path, 'wt') as fp:
+        json.dump(columns, fp, separators=(',', ':'))
+
+
+def read_results(file_path):
+    """Read a results file back into columns"""
+    with gzip.open(file_path, 'rt') as fp:
+        return json.load(fp)
+
+
+def print_summary(summary):
+    """Print the aggregated stats"""
+    print(f"Runs: {summary['runs']}")
+    for name, value in summary.items():
+        if name != 'runs':
+            mean, low, high = value
+            print(f'{name:>28}: {mean:10.3f}  [{low:.3f}, {high:.3f}]')
+
+
+def main(argv=None):
+    """Batch command line entry point"""
+    parser = argparse.ArgumentParser(description='Run seeded headless Space Bots missions in parallel')
+    parser.add_argument('mission', help='The mission (e.g. mission_18 or 18)')
+    parser.add_argument('--runs', type=int, default=100, help='Number of runs')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: all cores)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the first run (run N uses seed + N)')
+    parser.add_argument('--max-ticks', type=int, default=MAX_TICKS, help='Max ticks per run')
+    parser.add_argument('--output', default=None, help='Results file (default: <mission>.json.gz)')
+    parser.add_argument('--mission-file', default=None, help='Mission spec file (default: the built in missions)')
+    args = parser.parse_args(argv)
+
+    # Run the batch, save the results, and print the summary
+    results = run_batch(args.mission, args.runs, args.workers, args.seed, args.max_ticks, args.mission_file)
+    columns = to_columns(results)
+    output = args.output or f'mission_{mission_level(args.mission)}.json.gz'
+    write_results(columns, output)
+    print(f'Results: {output}')
+    print_summary(aggregate(columns))
+
+
+# Simple test of the Batch functionality
+def test():
+    """Test for Batch functionality"""
+    import tempfile
+
+    # Same seed should give the same results (even across processes)
+    single = run_mission('mission_18', seed=3, max_ticks=200)
+    results = run_batch('mission_18', runs=4, workers=2, seed=2, max_ticks=200)
+    assert results[1] == single
+    assert [r['seed'] for r in results] == [2, 3, 4, 5]
+
+    # Columns, aggregation, and the results file
+    columns = to_columns(results)
+    summary = aggregate(columns)
+    assert summary['runs'] == 4
+    assert summary['ticks'][0] == 200
+    assert mean_confidence([]) == (0.0, 0.0, 0.0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'results.json.gz')
+        write_results(columns, file_path)
+        assert read_results(file_path) == columns
+    print_summary(summary)
+
+    # A mission without the test squads still runs (nothing to buff), liveness comes straight from the squads
+    universe = Universe(announcements=False, seed=1)
+    engine = HeadlessEngineAdapter(universe)
+    universe.set_game_engine(engine)
+    universe.mission_planner.set_mission(18)
+    assert engine.run(20, draw_every=0) == 20
+    assert not team_alive(universe, 'earth')
+
+
+if __name__ == "__main__":
+    main()
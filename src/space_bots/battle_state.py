@@ -1,32 +1,98 @@
 """BattleState: Class stores all the battle state (ship, asteroids, etc) for Space Bots"""
+from collections import defaultdict
 
 # Local imports
-from space_bots.utils import force_utils
+from space_bots.utils.spatial_hash import SpatialHash
 
 
 class BattleState:
     """"BattleState: Class stores all the battle state (ship, asteroids, etc) for Space Bots"""
+
+    # Cell size for the enemy spatial index (scanner range queries cover a handful of cells)
+    grid_cell_size = 250
+
     def __init__(self, universe, scanner_range):
 
         # Set my attributes
         self.universe = universe
         self.scanner_range = scanner_range
 
+        # Team partitions of all_ships (built once per tick, see invalidate())
+        self._team_ships = None
+        self._enemy_ships = None
+
+        # Spatial index of the enemies of each team (built once per tick, see positions_changed())
+        self._enemy_grids = {}
+
+    def invalidate(self):
+        """The Universe rebuilt all_ships, so the cached team partitions need to be rebuilt"""
+        self._team_ships = None
+        self._enemy_ships = None
+        self._enemy_grids = {}
+
+    def positions_changed(self):
+        """The Universe moved the ships, so the enemy spatial index needs to be rebuilt"""
+        self._enemy_grids = {}
+
+    def _partitions(self):
+        """Internal: Build the team partitions (only once per tick)"""
+        if self._team_ships is None:
+            self._team_ships = defaultdict(list)
+            for s in self.universe.all_ships:
+                self._team_ships[s.team].append(s)
+            self._enemy_ships = {}
+            self._enemy_grids = {}
+        return self._team_ships
+
+    def _enemy_grid(self, team):
+        """Internal: Spatial index over all the ships NOT on the given team (built on first use)"""
+        enemies = self.enemy_ships(team)
+        grid = self._enemy_grids.get(team)
+        if grid is None:
+            grid = SpatialHash(self.grid_cell_size)
+            grid.rebuild(enemies)
+            self._enemy_grids[team] = grid
+        return grid
+
     def all_ships(self):
         """Ask the battle state for ALL the ships"""
         return self.universe.all_ships
 
     def zerg_ships(self):
-        return [s for s in self.universe.all_ships if s.team == 'zerg']
+        """All the zerg ships (cached view, don't modify)"""
+        return self._partitions().get('zerg', [])
+
+    def enemy_ships(self, team):
+        """All the ships NOT on the given team (cached view, don't modify)"""
+        self._partitions()
+        if team not in self._enemy_ships:
+            self._enemy_ships[team] = [s for s in self.universe.all_ships if s.team != team]
+        return self._enemy_ships[team]
+
+    def enemies_within(self, team, x, y, radius):
+        """All the ships NOT on the given team within radius of (x, y) (in all_ships order)"""
+        grid = self._enemy_grid(team)
+        return [grid.entities[i] for i in grid.within(x, y, radius)]
+
+    def nearest_enemies(self, team, x, y, k=1, among=None):
+        """The k nearest ships NOT on the given team to (x, y), nearest first
+           Args:
+               team: The team asking
+               x, y: The query point
+               k: How many ships to return
+               among: Optional set of ships, only these ships are considered (e.g. a squad's adversaries)
+        """
+        grid = self._enemy_grid(team)
+        accept = None if among is None else among.__contains__
+        return [grid.entities[i] for i in grid.nearest(x, y, k, accept)]
 
     def adversary_ships(self, ship):
         """Ask the battle state for ships NOT on my team within the specified range"""
-        adversaries = [s for s in self.universe.all_ships if s.team != ship.team]
-        return [s for s in adversaries if force_utils.distance_between(ship, s) < self.scanner_range]
+        return self.enemies_within(ship.team, ship.x, ship.y, self.scanner_range)
 
     def team_ships(self, ship):
-        """Ask the battle state for all ships on my team"""
-        return [s for s in self.universe.all_ships if s.team == ship.team]
+        """Ask the battle state for all ships on my team (cached view, don't modify)"""
+        return self._partitions().get(ship.team, [])
 
     def all_asteroids(self):
         """Ask the battle state for ALL the asteroids"""
@@ -35,9 +101,7 @@ class BattleState:
     def lowest_health_teammate(self, ship):
         if not self.all_ships():
             return None
-        ship_health = [(s, s.health_percent()) for s in self.team_ships(ship)]
-        ship_health.sort(key=lambda tup: tup[1])
-        return [s[0] for s in ship_health][0]
+        return min(self.team_ships(ship), key=lambda s: s.health_percent(), default=None)
 
 
 # Simple test of the BattleState functionality
@@ -9,7 +9,7 @@ from space_bots.utils.sound_limiter import SoundLimiter
 class Comms:
     """Comms: Class for managing communications in Space Bots"""
 
-    def __init__(self):
+    def __init__(self, clock=None):
 
         # The main functionality of this comms class is a defaultdict of Queues
         # Someone can post/pus to a new channel and then a SINGLE consumer can pick
@@ -17,7 +17,7 @@ class Comms:
         self.channels = defaultdict(queue.SimpleQueue)
 
         # Limiter (yes we're using the sound limiter :)
-        self.limiter = SoundLimiter()
+        self.limiter = SoundLimiter(clock)
         self.limiter.add_limit('display', 0.5)
 
     def get_messages(self, channel):
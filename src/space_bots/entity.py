@@ -1,13 +1,24 @@
 """Entity: Abstract Base Class for all collidable/movable objects (ships, asteroids, etc)"""
+import math
+import weakref
 from abc import ABC, abstractmethod
 
 # Local Imports
-from space_bots.utils import force_utils
+from space_bots import world_arrays
 
 
 class Entity(ABC):
-    """Entity: Abstract Base Class for all collidable/movable objects (ships, asteroids, etc)"""
-    def __init__(self, game_engine, x=500, y=500, speed=None, mass=10, collision_radius=10):
+    """Entity: Abstract Base Class for all collidable/movable objects (ships, asteroids, etc)
+       Note: Position, forces, mass, and damping live in a WorldArrays store (the entity is a view on its slot)
+    """
+    __slots__ = ('world', 'world_index', 'game_engine', 'collision_radius', 'pad_radius', 'delete_me', '__weakref__')
+
+    def __init__(self, game_engine, x=500, y=500, speed=None, mass=10, collision_radius=10, world=None):
+        # Grab a slot in the world arrays (given back when this entity is garbage collected)
+        self.world = world or world_arrays.default_world()
+        self.world_index = self.world.allocate()
+        weakref.finalize(self, self.world.free, self.world_index)
+
         self.game_engine = game_engine
         self.x = x
         self.y = y
@@ -32,13 +43,69 @@ class Entity(ABC):
     def draw(self):
         pass
 
-    def move(self):
-        """Move the Entity based on the current set of forces and mass"""
-        force_utils.force_based_movement(self, self.speed)
+    @property
+    def x(self):
+        return self.world.x[self.world_index]
+
+    @x.setter
+    def x(self, value):
+        self.world.x[self.world_index] = value
+
+    @property
+    def y(self):
+        return self.world.y[self.world_index]
+
+    @y.setter
+    def y(self, value):
+        self.world.y[self.world_index] = value
+
+    @property
+    def force_x(self):
+        return self.world.force_x[self.world_index]
+
+    @force_x.setter
+    def force_x(self, value):
+        self.world.force_x[self.world_index] = value
+
+    @property
+    def force_y(self):
+        return self.world.force_y[self.world_index]
 
-        # Damping the force for next time
-        self.force_x *= self.force_damp
-        self.force_y *= self.force_damp
+    @force_y.setter
+    def force_y(self, value):
+        self.world.force_y[self.world_index] = value
+
+    @property
+    def mass(self):
+        return self.world.mass[self.world_index]
+
+    @mass.setter
+    def mass(self, value):
+        self.world.mass[self.world_index] = value
+
+    @property
+    def force_damp(self):
+        return self.world.force_damp[self.world_index]
+
+    @force_damp.setter
+    def force_damp(self, value):
+        self.world.force_damp[self.world_index] = value
+
+    @property
+    def speed(self):
+        """Speed limit for this Entity (None is no limit)"""
+        speed = self.world.speed[self.world_index]
+        return None if speed == math.inf else speed
+
+    @speed.setter
+    def speed(self, value):
+        self.world.speed[self.world_index] = math.inf if value is None else value
+
+    def move(self):
+        """Move the Entity based on the current set of forces and mass
+           Note: The move (and force damping) happens for ALL entities in one step when the Universe integrates
+        """
+        self.world.queue_move(self.world_index)
 
     def pre_delete(self):
         """All Entities have a pre_delete method where they might take some action/set stuff before being deleted"""
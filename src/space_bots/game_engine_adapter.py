@@ -2,15 +2,17 @@
 
 # Note: This class should be refactored to handle additional backends at some point
 #       Right now it's pygame specific, but later we'll have more options
-import os
+from collections import OrderedDict
 import pygame
 
 # Local imports
 from space_bots.sound_player import SoundPlayer
+from space_bots.asset_cache import AssetCache
 
 
 class GameEngineAdapter:
     """GameEngineAdapter: Class that handles display and sound stuff"""
+    preload_images = ['images/planet_brown.png']
 
     def __init__(self, universe, width=1600, height=1000):
         """Initialize the GameEngineAdapter class"""
@@ -26,6 +28,12 @@ class GameEngineAdapter:
         self.background_color = (20, 20, 30)
         self.collision_detection = None
 
+        # Pre-rendered sprites (LRU, least recently drawn sprites get dropped)
+        # Note: Sprites use a colorkey (RLE blits), pygame circles aren't antialiased so there's no edge blending
+        self.sprites = OrderedDict()
+        self.max_sprites = 1024
+        self.sprite_colorkey = (255, 0, 255)
+
         # Get a random font
         self.font = pygame.font.SysFont('calibri', 36, italic=True)
 
@@ -35,10 +43,13 @@ class GameEngineAdapter:
         # Clock
         self.clock = pygame.time.Clock()
 
+        # Images are loaded once and shared (see get_image())
+        self.assets = AssetCache(self.image_load)
+        self.assets.preload(self.preload_images)
+
         # Background Image
         try:
-            image_path = os.path.join(os.path.dirname(__file__), 'images/space_background.png')
-            self.background_image = self.image_load(image_path, width, height).convert()
+            self.background_image = self.get_image('images/space_background.png', width, height, alpha=False)
         except FileNotFoundError:
             self.background_image = None
 
@@ -53,6 +64,10 @@ class GameEngineAdapter:
         """Play the background music mix"""
         self.sound_player.play_background_music()
 
+    def prefetch_sounds(self, clip_tags):
+        """Decode these sound clips in the background (they're decoded on first use otherwise)"""
+        self.sound_player.prefetch(clip_tags)
+
     def play_sound_queue(self):
         """Play the sound with the given sound name"""
         self.sound_player.play_queue()
@@ -68,8 +83,12 @@ class GameEngineAdapter:
     def set_background_color(self, color):
         self.background_color = color
 
-    def event_loop(self):
-        """Main Event Loop for the Display"""
+    def event_loop(self, draw_every=1):
+        """Main Event Loop for the Display
+           Args:
+               draw_every: Only render every Nth tick (e.g. 4 for fast-forward), the battle outcome is the same
+        """
+        tick = 0
         while self.running:
 
             # 120 Frames/second
@@ -79,16 +98,20 @@ class GameEngineAdapter:
             if self.check_for_quit():
                 self.quit()
 
-            # Draw the background
-            self.draw_background()
-
-            # Call the three callbacks
+            # Call the communicate() and update() callbacks
             self.universe.communicate()
             self.universe.update()
-            self.universe.draw()
 
-            # Flip the display
-            pygame.display.flip()
+            # Draw the background, the Universe, and flip the display
+            if tick % draw_every == 0:
+                self.draw_frame()
+            tick += 1
+
+    def draw_frame(self):
+        """Draw the background, the Universe, and flip the display"""
+        self.draw_background()
+        self.universe.draw()
+        pygame.display.flip()
 
     def draw_circle(self, color, center, radius, width=3):
         """Draw a Circle with the given parameters"""
@@ -98,6 +121,30 @@ class GameEngineAdapter:
         """Draw a Line with the given parameters"""
         pygame.draw.line(self.screen, color, start, end, width)
 
+    def draw_sprite(self, key, center, radius, render):
+        """Blit the pre-rendered sprite for this key centered at center
+           Args:
+               key: Hashable key for the sprite (everything that changes how it looks)
+               center: Where to draw the sprite on the screen
+               radius: Half the size of the sprite
+               render: On a cache miss render(key, draw_circle, sprite_center) draws the sprite
+        """
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1)).convert()
+            sprite.fill(self.sprite_colorkey)
+
+            def draw_circle(color, circle_center, circle_radius, width=3):
+                pygame.draw.circle(sprite, color, circle_center, circle_radius, width)
+            render(key, draw_circle, (radius, radius))
+            sprite.set_colorkey(self.sprite_colorkey, pygame.RLEACCEL)
+            self.sprites[key] = sprite
+            if len(self.sprites) > self.max_sprites:
+                self.sprites.popitem(last=False)
+        else:
+            self.sprites.move_to_end(key)
+        self.screen.blit(sprite, (center[0] - radius, center[1] - radius))
+
     def draw_mineral(self, color, center, radius):
         """Draw a Circle with the given parameters"""
         pygame.draw.circle(self.screen, color, center, radius, width=0)
@@ -118,6 +165,26 @@ class GameEngineAdapter:
             _image = pygame.transform.scale(_image, (x_size, y_size))
         return _image
 
+    def render_surface(self, width, height, render):
+        """Render onto a new (transparent) surface instead of the screen
+           Args:
+               width, height: Size of the surface
+               render: Function that draws (with the usual draw_* methods) while the surface is the target
+           Returns:
+               Surface: The rendered surface (blit it with draw_image())
+        """
+        surface = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        screen, self.screen = self.screen, surface
+        try:
+            render()
+        finally:
+            self.screen = screen
+        return surface
+
+    def get_image(self, image_file, x_size=0, y_size=0, alpha=True):
+        """Shared (cached) image handle, the file is only loaded/converted the first time"""
+        return self.assets.image(image_file, x_size, y_size, alpha)
+
     def draw_image(self, image, x, y):
         self.screen.blit(image, (x, y))
 
@@ -0,0 +1,191 @@
+"""HeadlessEngineAdapter: A GameEngineAdapter with no display or sound (batch runs, balance sweeps, and CI)"""
+import struct
+from collections import Counter
+
+# Local imports
+from space_bots.asset_cache import AssetCache
+
+
+class ImageStub:
+    """ImageStub: Stands in for a pygame Surface when running headless (it just knows its size)"""
+    def __init__(self, width=0, height=0):
+        self.width = width
+        self.height = height
+
+    def get_size(self):
+        return self.width, self.height
+
+    def get_bytesize(self):
+        return 4
+
+    def convert(self):
+        return self
+
+    def convert_alpha(self):
+        return self
+
+
+class HeadlessEngineAdapter:
+    """HeadlessEngineAdapter: A GameEngineAdapter with no display or sound (batch runs, balance sweeps, and CI)
+       Usage:
+            engine = HeadlessEngineAdapter(universe)
+            universe.set_game_engine(engine)
+            engine.run(ticks=5000)  # No frame throttle, runs as fast as the CPU allows
+    """
+
+    def __init__(self, universe, width=1600, height=1000):
+        """Initialize the HeadlessEngineAdapter class"""
+        self.width = width
+        self.height = height
+        self.running = True
+        self.background_color = (20, 20, 30)
+        self.ticks = 0
+
+        # Sounds/Announcements are just counted
+        self.sound_counts = Counter()
+        self.announce_counts = Counter()
+
+        # Images (stubs) are loaded once and shared, same as the GameEngineAdapter
+        self.assets = AssetCache(self.image_load)
+
+        # Universe has 3 callbacks (communicate(), update() and draw()
+        self.universe = universe
+
+    def get_surface(self):
+        """There's no drawable surface when headless"""
+        return None
+
+    def play_background_music(self):
+        """Count the background music 'plays'"""
+        self.sound_counts['background_music'] += 1
+
+    def prefetch_sounds(self, clip_tags):
+        """Nothing to decode when headless"""
+        pass
+
+    def play_sound_queue(self):
+        """Nothing is queued when headless"""
+        pass
+
+    def restricted_play_sound(self, sound_name):
+        """Count the sound instead of playing it"""
+        self.sound_counts[sound_name] += 1
+
+    def restricted_announce(self, sound_name, voice='random'):
+        """Count the announcement instead of playing it"""
+        self.announce_counts[sound_name] += 1
+        return True
+
+    def set_background_color(self, color):
+        self.background_color = color
+
+    def run(self, ticks=None, draw_every=1):
+        """Run the Universe (no frame throttle) for the given number of ticks (None = until quit)
+           Args:
+               ticks: Number of ticks to run
+               draw_every: Only call the Universe draw() every Nth tick (0 = never)
+           Returns:
+               int: The number of ticks that were run
+        """
+        tick = 0
+        while self.running and (ticks is None or tick < ticks):
+            self.universe.communicate()
+            self.universe.update()
+            if draw_every and tick % draw_every == 0:
+                self.universe.draw()
+            tick += 1
+        self.ticks += tick
+        return tick
+
+    def draw_frame(self):
+        """Let the Universe 'draw' (nothing is displayed)"""
+        self.universe.draw()
+
+    def event_loop(self, draw_every=1):
+        """Main Event Loop (runs until quit), same signature as the GameEngineAdapter so they can be swapped
+           Args:
+               draw_every: Only call the Universe draw() every Nth tick (nothing is displayed headless anyway)
+        """
+        self.run(draw_every=draw_every)
+
+    def draw_circle(self, color, center, radius, width=3):
+        pass
+
+    def draw_line(self, color, start, end, width=2):
+        pass
+
+    def draw_mineral(self, color, center, radius):
+        pass
+
+    def draw_polygon(self, color, points, width=3):
+        pass
+
+    def draw_sprite(self, key, center, radius, render):
+        pass
+
+    def draw_text(self, text, color=(140, 200, 140), pos='bottom'):
+        pass
+
+    @staticmethod
+    def image_load(image_file, x_size=0, y_size=0):
+        """Return a sized stub for the image (reads the size from a PNG header, doesn't decode anything)"""
+        if x_size:
+            return ImageStub(x_size, y_size)
+        with open(image_file, 'rb') as fp:
+            header = fp.read(24)
+        if header[:8] == b'\x89PNG\r\n\x1a\n':
+            return ImageStub(*struct.unpack('>II', header[16:24]))
+        return ImageStub()
+
+    def render_surface(self, width, height, render):
+        """Nothing is rendered headless, just return a sized stub"""
+        return ImageStub(width, height)
+
+    def get_image(self, image_file, x_size=0, y_size=0, alpha=True):
+        """Shared (cached) image stub"""
+        return self.assets.image(image_file, x_size, y_size, alpha)
+
+    def draw_image(self, image, x, y):
+        pass
+
+    def draw_background(self):
+        pass
+
+    def check_for_quit(self):
+        return not self.running
+
+    def quit(self):
+        """Quit the main event loop"""
+        self.running = False
+
+
+# Simple test of the HeadlessEngineAdapter functionality
+def test():
+    """Test for HeadlessEngineAdapter Class"""
+    from space_bots.universe import Universe
+
+    # Create a Universe
+    my_universe = Universe()
+
+    # Create the Game Engine
+    my_game_engine = HeadlessEngineAdapter(my_universe)
+
+    # Give the universe the game engine
+    my_universe.set_game_engine(my_game_engine)
+
+    # Asteroid images should come back as sized stubs
+    my_universe.mission_planner.set_mission(18, test_squads=True)
+    assert my_universe.asteroids[0].asteroid_image.get_size() == (80, 80)
+    assert all(a.asteroid_image is my_universe.asteroids[0].asteroid_image for a in my_universe.asteroids)
+    assert my_game_engine.assets.num_loads == 1
+
+    # Run a few hundred ticks as fast as we can
+    assert my_game_engine.run(ticks=300) == 300
+    assert my_universe.all_ships
+    assert my_game_engine.sound_counts['background_music'] == 1
+    print(f'Sounds: {dict(my_game_engine.sound_counts)}')
+    print(f'Announcements: {dict(my_game_engine.announce_counts)}')
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,293 @@
+"""MissionCompiler: Validates the mission specs and compiles them into immutable events (sorted by time)
+
+   Usage:
+        python -m space_bots.mission_compiler                      # Validate all the missions
+        python -m space_bots.mission_compiler my_missions.json     # Validate a different spec file
+"""
+import os
+import sys
+import json
+import argparse
+from typing import NamedTuple, Optional, Tuple
+
+# Local Imports
+from space_bots.ships.specs.ship_catalog import ship_specs
+
+# Default mission specs (all the missions in one file)
+MISSION_SPECS = os.path.join(os.path.dirname(__file__), 'missions/mission_specs.json')
+
+# What the specs are allowed to say
+SQUAD_PACK = 'standard_zerg_pack'
+TARGETING = ('nearest', 'threat', 'low_health', 'random', 'no_target')
+TEST_SHIP_TYPES = ('healer', 'tank', 'fighter', 'miner', 'drone')
+FOCUS_TYPES = ('protect', 'attack')
+
+
+class MissionSpecError(ValueError):
+    """A mission spec that doesn't validate (the message says which mission/event)"""
+    pass
+
+
+class SquadEvent(NamedTuple):
+    """Add a Zerg Squad (squad_type is a ship type or a standard_zerg_pack)"""
+    squad_type: str
+    count: int = 0
+    pack_size: float = 0.0
+    level: int = 1
+    targeting: str = 'nearest'
+
+
+class FocusOrder(NamedTuple):
+    """Protect/Attack orders for a test squad (target is an asteroid, squad name, or ship type)"""
+    focus_type: str
+    source: str
+    target: str
+    distance: Optional[float] = None
+
+
+class MissionEvent(NamedTuple):
+    """Something that happens at a given time (seconds after the mission begins)"""
+    time: float
+    squad: Optional[SquadEvent] = None
+    orders: Tuple[FocusOrder, ...] = ()
+
+
+class SquadShip(NamedTuple):
+    """A ship in an Earth (test) squad"""
+    ship_type: str
+    level: int = 1
+
+
+class EarthSquad(NamedTuple):
+    """An Earth (test) squad for checking the mission balance"""
+    name: str
+    ships: Tuple[SquadShip, ...]
+    targeting: str = 'threat'
+
+
+class Mission(NamedTuple):
+    """A compiled mission (events are sorted by time)"""
+    name: str
+    title: str
+    minerals: int
+    events: Tuple[MissionEvent, ...]
+    test_squads: Tuple[EarthSquad, ...]
+
+
+# Compiled missions for this process: (file_path, mission_name) -> Mission
+_compiled = {}
+
+
+def mission_name(mission):
+    """Mission can be given as 18, '18', or 'mission_18' (any other name is used as is)"""
+    return f'mission_{mission}' if str(mission).isdigit() else str(mission)
+
+
+def load_mission(mission, file_path=None):
+    """Get the compiled mission (the spec file is only parsed the first time this process asks for the mission)
+       Args:
+           mission: The mission (e.g. 18 or 'mission_18')
+           file_path: Spec file, either all the missions or a single mission file (default: MISSION_SPECS)
+    """
+    file_path = file_path or MISSION_SPECS
+    name = mission_name(mission)
+    key = (file_path, name)
+    if key not in _compiled:
+        specs = read_specs(file_path)
+        if name not in specs:
+            raise MissionSpecError(f'{name}: not found in {file_path}')
+        _compiled[key] = compile_mission(name, specs[name])
+    return _compiled[key]
+
+
+def load_missions(file_path=None):
+    """Compile (and cache) all the missions in the spec file
+       Returns:
+           dict: mission_name -> Mission
+    """
+    file_path = file_path or MISSION_SPECS
+    missions = {}
+    for name, spec in read_specs(file_path).items():
+        key = (file_path, name)
+        if key not in _compiled:
+            _compiled[key] = compile_mission(name, spec)
+        missions[name] = _compiled[key]
+    return missions
+
+
+def read_specs(file_path):
+    """Read a spec file: {mission_name: spec, ...} or a single mission spec (named after the file)"""
+    with open(file_path) as fp:
+        specs = json.load(fp)
+    if 'event_sequence' in specs:
+        return {os.path.splitext(os.path.basename(file_path))[0]: specs}
+    return specs
+
+
+def compile_mission(name, spec):
+    """Validate a mission spec and compile it into a Mission
+       Raises:
+           MissionSpecError: If anything in the spec is wrong
+    """
+    _check(isinstance(spec, dict), name, 'spec should be an object')
+    _check_keys(spec, {'title', 'minerals', 'event_sequence', 'test_squads'}, name)
+    _check(isinstance(spec.get('title'), str), name, "'title' is required")
+    minerals = spec.get('minerals', 10)
+    _check(_is_int(minerals) and minerals > 0, name, "'minerals' should be a positive integer")
+    _check(isinstance(spec.get('event_sequence'), list), name, "'event_sequence' should be a list")
+    _check(isinstance(spec.get('test_squads', []), list), name, "'test_squads' should be a list")
+
+    events = [_compile_event(event, f'{name}: event {n}') for n, event in enumerate(spec['event_sequence'])]
+    test_squads = [_compile_test_squad(squad, f'{name}: test squad {n}')
+                   for n, squad in enumerate(spec.get('test_squads', []))]
+    return Mission(name, spec['title'], minerals, tuple(sorted(events, key=lambda e: e.time)), tuple(test_squads))
+
+
+def _compile_event(event, where):
+    """Internal: Compile a single event_sequence entry"""
+    _check(isinstance(event, dict), where, 'should be an object')
+    _check_keys(event, {'time', 'event_info'}, where)
+    _check(_is_number(event.get('time')) and event['time'] >= 0, where, "'time' should be a number >= 0")
+    event_info = event.get('event_info')
+    _check(isinstance(event_info, dict) and event_info, where, "'event_info' should be a non-empty object")
+    _check_keys(event_info, {'squad', *FOCUS_TYPES}, where)
+
+    squad = _compile_squad(event_info['squad'], f'{where}: squad') if 'squad' in event_info else None
+    orders = []
+    for focus_type in FOCUS_TYPES:
+        _check(isinstance(event_info.get(focus_type, {}), dict), where, f"'{focus_type}' should be an object")
+        for source, target_info in event_info.get(focus_type, {}).items():
+            orders.append(_compile_order(focus_type, source, target_info, f'{where}: {focus_type} {source}'))
+    return MissionEvent(event['time'], squad, tuple(orders))
+
+
+def _compile_squad(squad, where):
+    """Internal: Compile a squad event (a standard pack needs a pack_size, a ship type needs a count)"""
+    _check(isinstance(squad, dict), where, 'should be an object')
+    _check_keys(squad, {'type', 'count', 'pack_size', 'level', 'targeting'}, where)
+    squad_type = squad.get('type')
+    _check(squad_type == SQUAD_PACK or squad_type in ship_specs, where, f"unknown 'type' {squad_type!r}")
+    if squad_type == SQUAD_PACK:
+        _check(_is_number(squad.get('pack_size')) and squad['pack_size'] > 0, where, "'pack_size' should be > 0")
+    else:
+        _check(_is_int(squad.get('count')) and squad['count'] > 0, where, "'count' should be a positive integer")
+    level = squad.get('level', 1)
+    _check(_is_int(level) and level >= 1, where, "'level' should be an integer >= 1")
+    targeting = squad.get('targeting', 'nearest')
+    _check(targeting in TARGETING, where, f"unknown 'targeting' {targeting!r}")
+    return SquadEvent(squad_type, squad.get('count', 0), squad.get('pack_size', 0.0), level, targeting)
+
+
+def _compile_order(focus_type, source, target_info, where):
+    """Internal: Compile a protect/attack order"""
+    _check(isinstance(target_info, dict) and isinstance(target_info.get('target'), str), where,
+           "'target' is required")
+    _check_keys(target_info, {'target', 'distance'}, where)
+    distance = target_info.get('distance', 150) if focus_type == 'protect' else None
+    _check(distance is None or (_is_number(distance) and distance > 0), where, "'distance' should be > 0")
+    return FocusOrder(focus_type, source, target_info['target'], distance)
+
+
+def _compile_test_squad(squad, where):
+    """Internal: Compile a test squad"""
+    _check(isinstance(squad, dict), where, 'should be an object')
+    _check_keys(squad, {'name', 'ships', 'targeting'}, where)
+    _check(isinstance(squad.get('name'), str), where, "'name' is required")
+    _check(isinstance(squad.get('ships'), list), where, "'ships' should be a list")
+    targeting = squad.get('targeting', 'threat')
+    _check(targeting in TARGETING, where, f"unknown 'targeting' {targeting!r}")
+    ships = []
+    for n, ship in enumerate(squad['ships']):
+        ship_where = f'{where}: ship {n}'
+        _check(isinstance(ship, dict), ship_where, 'should be an object')
+        _check_keys(ship, {'type', 'level'}, ship_where)
+        _check(ship.get('type') in TEST_SHIP_TYPES, ship_where, f"unknown 'type' {ship.get('type')!r}")
+        level = ship.get('level', 1)
+        _check(_is_int(level) and level >= 1, ship_where, "'level' should be an integer >= 1")
+        ships.append(SquadShip(ship['type'], level))
+    return EarthSquad(squad['name'], tuple(ships), targeting)
+
+
+def _check(condition, where, message):
+    """Internal: Raise a MissionSpecError (saying where) if the condition isn't met"""
+    if not condition:
+        raise MissionSpecError(f'{where}: {message}')
+
+
+def _check_keys(spec, allowed, where):
+    """Internal: Typos in the spec keys shouldn't be silently ignored"""
+    unknown = set(spec) - set(allowed)
+    _check(not unknown, where, f'unknown keys {sorted(unknown)}')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def main(argv=None):
+    """Mission Compiler command line entry point (validate all the missions in a spec file)"""
+    parser = argparse.ArgumentParser(description='Validate/compile Space Bots mission specs')
+    parser.add_argument('file_path', nargs='?', default=MISSION_SPECS, help='Mission spec file')
+    args = parser.parse_args(argv)
+    try:
+        missions = load_missions(args.file_path)
+    except MissionSpecError as error:
+        print(f'Mission Spec Error: {error}')
+        sys.exit(1)
+    for mission in missions.values():
+        print(f'{mission.name:>12}: {len(mission.events):3} events  {mission.title}')
+    print(f'{len(missions)} missions OK')
+
+
+# Simple test of the MissionCompiler functionality
+def test():
+    """Test for MissionCompiler functionality"""
+    import tempfile
+
+    # All the shipped missions compile, and they're only compiled once per process
+    missions = load_missions()
+    assert len(missions) == 29
+    assert load_mission(18) is missions['mission_18'] is load_mission('mission_18')
+    mission = missions['mission_18']
+    assert mission.title == 'Mission 18: Waves' and mission.minerals == 30
+    assert mission.events[0] == MissionEvent(10, SquadEvent(SQUAD_PACK, pack_size=1.5, level=2))
+    assert all(a.time <= b.time for m in missions.values() for a, b in zip(m.events, m.events[1:]))
+
+    # Events are sorted by time (and protect/attack orders compile)
+    spec = {'title': 'Test', 'test_squads': [{'name': 'rocks', 'ships': [{'type': 'tank', 'level': 2}]}],
+            'event_sequence': [{'time': 20, 'event_info': {'squad': {'type': 'zergling', 'count': 5}}},
+                               {'time': 5, 'event_info': {'protect': {'rocks': {'target': 'asteroid'}}}}]}
+    mission = compile_mission('test', spec)
+    assert [e.time for e in mission.events] == [5, 20]
+    assert mission.events[0].orders == (FocusOrder('protect', 'rocks', 'asteroid', 150),)
+    assert mission.test_squads == (EarthSquad('rocks', (SquadShip('tank', 2),)),)
+
+    # Mistakes are caught up front (and say where they are)
+    bad_specs = [
+        ({'type': 'zergling'}, "count"),                          # Missing count
+        ({'type': 'zerglings', 'count': 5}, "unknown 'type'"),    # Typo in the type
+        ({'type': SQUAD_PACK, 'pack_sise': 2}, 'unknown keys'),   # Typo in a key
+        ({'type': SQUAD_PACK, 'pack_size': 2, 'targeting': 'closest'}, "unknown 'targeting'"),
+    ]
+    for squad, message in bad_specs:
+        bad = dict(spec, event_sequence=[{'time': 1, 'event_info': {'squad': squad}}])
+        try:
+            compile_mission('bad', bad)
+            assert False, f'{squad} should not compile'
+        except MissionSpecError as error:
+            assert str(error).startswith('bad: event 0: squad') and message in str(error)
+
+    # Single mission files
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, 'mission_test.json')
+        with open(file_path, 'w') as fp:
+            json.dump(spec, fp)
+        assert load_mission('mission_test', file_path) == compile_mission('mission_test', spec)
+
+
+if __name__ == "__main__":
+    main()
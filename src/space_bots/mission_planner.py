@@ -1,15 +1,13 @@
 """MissionPlanner: Class for Mission Planning in Space Bots"""
-import os
-import json
-import time
 from random import randint
-from queue import Queue
+from collections import deque
 
 # Local Imports
-from space_bots import squad
+from space_bots import squad, mission_compiler
 from space_bots.asteroid import Asteroid
 from space_bots.ships import drone, miner, healer, tank, fighter
 from space_bots.ships import zergling, ship
+from space_bots.utils import placement
 
 
 class MissionPlanner:
@@ -20,25 +18,25 @@ class MissionPlanner:
         self.universe = universe
         self.mission_level = None
         self.current_mission = None
-        self.test_squads = None
+        self.test_squads = []
         self.test_squads_pos = (300, 500)
         self.zerg_pos = (1100, 700)
         self.mission_asteroid = None
         self.mission_begin_time = None
-        self.event_queue = Queue()
-
-        # Read in Mission Specifications
-        file_path = os.path.join(os.path.dirname(__file__), 'missions/mission_specs.json')
-        with open(file_path) as fp:
-            self.mission_specs = json.load(fp)
-
-    def set_mission(self, mission_level, test_squads=False):
-        """Set a Specific Mission"""
-        mission_name = f"mission_{mission_level}"
-        self.current_mission = self.mission_specs[mission_name]
+        self.event_queue = deque()
+
+    def set_mission(self, mission_level, test_squads=False, mission_file=None):
+        """Set a Specific Mission
+           Args:
+               mission_level: The mission (e.g. 18 or 'mission_18')
+               test_squads: Add the mission test squads
+               mission_file: Optional spec file (all the missions or a single mission file)
+        """
+        # Mission specs are compiled (and validated) once per process
+        self.current_mission = mission_compiler.load_mission(mission_level, mission_file)
 
         # Add some asteroids
-        minerals = self.current_mission.get('minerals', 10)
+        minerals = self.current_mission.minerals
         for _ in range(12):
             my_asteroid = Asteroid(self.universe.game_engine, randint(300, 1200), randint(200, 700), minerals)
             self.universe.add_asteroid(my_asteroid)
@@ -47,12 +45,15 @@ class MissionPlanner:
         if test_squads:
             self.add_test_squads()
 
-        # Set up the mission event queue
-        for event in self.current_mission['event_sequence']:
-            self.event_queue.put(event)
+        # Set up the mission event queue (compiled events are already sorted by time)
+        self.event_queue = deque(self.current_mission.events)
 
         # Set the Universe Text
-        self.universe.top_text = self.current_mission['title']
+        self.universe.top_text = self.current_mission.title
+
+    def events_remaining(self):
+        """Number of mission events that haven't happened yet"""
+        return len(self.event_queue)
 
     def buff_squads(self):
         self.universe.game_engine.restricted_announce('power_cord_d', None)
@@ -62,6 +63,10 @@ class MissionPlanner:
 
     def add_zerg_squad(self, ship_type, num_ships, targeting, level=1):
         """Add a Zerg Squad to the mission"""
+        self._add_zerg_squads([self._zerg_squad(ship_type, num_ships, targeting, level)])
+
+    def _zerg_squad(self, ship_type, num_ships, targeting, level=1):
+        """Internal: Create a Zerg Squad (at the zerg spawn point, not added to the Universe yet)"""
         x = self.zerg_pos[0]
         y = self.zerg_pos[1]
         zerg_squad = squad.Squad('zerg', 'bugs_are_cool', target_strategy=targeting)
@@ -71,7 +76,13 @@ class MissionPlanner:
         else:
             for _ in range(num_ships):
                 zerg_squad.add_ship(ship.Ship(self.universe.game_engine, x=x, y=y, ship_type=ship_type, level=level))
-        self.universe.add_squad(zerg_squad)
+        return zerg_squad
+
+    def _add_zerg_squads(self, zerg_squads):
+        """Internal: Spread the squads out around the spawn point together (so they don't land on each other)"""
+        placement.spawn_around([_ship for _squad in zerg_squads for _ship in _squad.ships], *self.zerg_pos)
+        for zerg_squad in zerg_squads:
+            self.universe.add_squad(zerg_squad)
 
     def standard_zerg_pack(self, pack_size=1.0, targeting='nearest', level=1):
         """Add a predefined/diverse set of Zerg Squads to the mission"""
@@ -88,24 +99,25 @@ class MissionPlanner:
         print(f'Pack Size: {pack_size}')
         pack['mega_bug'] = num_mega_bugs*1.01/pack_size
 
-        # Rest of the ships
+        # Rest of the ships (the whole pack is placed in one go)
+        zerg_squads = []
         for ship_type, count in pack.items():
             num_ships = int(count * pack_size)
             if num_ships:
-                self.add_zerg_squad(ship_type, num_ships, targeting, level)
+                zerg_squads.append(self._zerg_squad(ship_type, num_ships, targeting, level))
+        self._add_zerg_squads(zerg_squads)
 
     def add_test_squads(self):
         """We can add 'earth' Squads to test the Mission balance/level/etc"""
 
         # Add out Test Squads
         self.test_squads = []
-        for squad_info in self.current_mission['test_squads']:
+        for squad_info in self.current_mission.test_squads:
 
             # Add Squad and Ships
-            targeting = squad_info.get('targeting', 'threat')
-            new_squad = squad.Squad('earth', squad_info['name'], target_strategy=targeting)
-            for ship_info in squad_info['ships']:
-                self._add_ship_to_test_squad(new_squad, ship_info['type'], ship_info['level'])
+            new_squad = squad.Squad('earth', squad_info.name, target_strategy=squad_info.targeting)
+            for ship_info in squad_info.ships:
+                self._add_ship_to_test_squad(new_squad, ship_info.ship_type, ship_info.level)
             self.test_squads.append(new_squad)
 
         # Add the Test Squads to the Universe
@@ -170,53 +182,51 @@ class MissionPlanner:
     def update(self):
         """Main Mission Planner Functionality"""
         if self.mission_begin_time is None:
-            self.mission_begin_time = time.time()
+            self.mission_begin_time = self.universe.clock.time()
             self.buff_squads()
 
         # If we have no more events in this mission just return
-        if self.event_queue.empty():
+        if not self.event_queue:
             return
 
         # Go through this mission event sequence
-        now = time.time()
-
-        # Let's check the time on the next event (without popping)
-        peek_event = self.event_queue.queue[0]
+        now = self.universe.clock.time()
 
-        # If the event is ready then get() it off the event queue and process
-        if peek_event['time'] + self.mission_begin_time < now:
-            event_info = self.event_queue.get()['event_info']
+        # If the next event is ready then pop it off the event queue and process
+        if self.event_queue[0].time + self.mission_begin_time < now:
+            event = self.event_queue.popleft()
 
             # Add Squads
-            if 'squad' in event_info:
-                squad_info = event_info['squad']
+            squad_info = event.squad
+            if squad_info:
                 # Add a Standard Zerg Pack
-                if squad_info['type'] == 'standard_zerg_pack':
-                    self.standard_zerg_pack(squad_info['pack_size'], squad_info.get('targeting', 'nearest'),
-                                            squad_info.get('level', 1))
+                if squad_info.squad_type == mission_compiler.SQUAD_PACK:
+                    self.standard_zerg_pack(squad_info.pack_size, squad_info.targeting, squad_info.level)
 
                 # Add an individual Squad
                 else:
-                    self.add_zerg_squad(squad_info['type'], squad_info['count'],
-                                        squad_info.get('targeting', 'nearest'), squad_info.get('level', 1))
-
-            # Protection Orders
-            if 'protect' in event_info:
-                for source, target_info in event_info['protect'].items():
-                    target = target_info['target']
-                    distance = target_info.get('distance', 150)
-                    self._set_focus_orders(source, target, focus_type='protect', distance=distance)
-
-            # Attack Target Orders
-            if 'attack' in event_info:
-                for source, target_info in event_info['attack'].items():
-                    target = target_info['target']
-                    self._set_focus_orders(source, target, focus_type='attack')
+                    self.add_zerg_squad(squad_info.squad_type, squad_info.count, squad_info.targeting,
+                                        squad_info.level)
+
+            # Protection/Attack Orders
+            for order in event.orders:
+                self._set_focus_orders(order.source, order.target, focus_type=order.focus_type,
+                                       distance=order.distance)
+
+    def sound_clips(self):
+        """Sound clips this mission will probably need (match announcements and the earth ships voice lines)"""
+        clip_tags = ['lets_rumble', 'won_match', 'lost_match', 'laser', 'explosion', 'drone_death', 'uff']
+        for ship_type in sorted({_ship.ship_type for _ship in self.universe.all_ships if _ship.team == 'earth'}):
+            clip_tags += [f'{ship_type}_low', f'{ship_type}_down']
+        return clip_tags
 
     def finalize(self):
         """Mission Planner Finalize"""
         print('Mission Planner Finalize...')
 
+        # Get the sound clips decoding in the background
+        self.universe.game_engine.prefetch_sounds(self.sound_clips())
+
 
 # Simple test of the MissionPlanner functionality
 def test():
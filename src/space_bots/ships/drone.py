@@ -6,6 +6,9 @@ from space_bots.ships import ship
 
 class Drone(ship.Ship):
     """Drone: A Drone ship in Space Bots"""
+    __slots__ = ('protect_asset',)
+    avoidance = 2.0  # Drones should be careful
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -24,7 +27,6 @@ class Drone(ship.Ship):
         # General updates
         self.general_ship_updates()
         self.general_targeting()
-        self.general_avoidance(passive=2.0)
         self.general_target_movement(aggressive=0.1)  # Drones should be careful
 
         # Now actually call the move command (which uses force/mass calc)
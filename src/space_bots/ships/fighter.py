@@ -7,6 +7,8 @@ from space_bots.utils import weapon, laser_guns
 
 class Fighter(ship.Ship):
     """Fighter: A Fighter ship in Space Bots"""
+    __slots__ = ('mad_thrown',)
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -29,7 +31,6 @@ class Fighter(ship.Ship):
         # General updates
         self.general_ship_updates()
         self.general_targeting()
-        self.general_avoidance()
         self.general_target_movement(aggressive=1.5)
 
         # If the Fighter gets low health cast buff
@@ -7,6 +7,9 @@ from space_bots.ships import ship
 
 class Healer(ship.Ship):
     """Healer: A Healer ship in Space Bots"""
+    __slots__ = ('healing_target', 'healing_beam', 'salvation_thrown', 'blood_pact_thrown')
+    avoidance = 2.0  # Healer needs to avoid enemies
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -14,6 +17,7 @@ class Healer(ship.Ship):
 
         # Healer specific stuff
         self.healing_target = None
+        self.healing_beam = False
         self.salvation_thrown = False
         self.blood_pact_thrown = False
         self.squad_buffs = ['fortitude']
@@ -27,14 +31,13 @@ class Healer(ship.Ship):
 
         # General updates
         self.general_ship_updates()
-        self.general_avoidance(passive=2.0)  # Healer needs to avoid enemies
 
         # Get the lowest health TeamMate and move towards them
         self.healing_target = self.battle_info.lowest_health_teammate(self)
         if self.healing_target and self.healing_target != self:
-            (_, _), (dx, dy) = force_utils.attraction_forces(self.healing_target, self, self.p.laser_range/1.4)
-            self.force_x += dx * 2
-            self.force_y += dy * 2
+            target = self.healing_target
+            force_utils.add_attraction(self.world.force_x, self.world.force_y, None, self.world_index,
+                                       target.x, target.y, self.x, self.y, self.p.laser_range/1.4, t_scale=2)
 
             # Not going to cast spells on Drones
             if self.healing_target.ship_type != 'drone':
@@ -59,20 +62,31 @@ class Healer(ship.Ship):
         # Now actually call the move command
         self.move()
 
-    def draw(self):
-        """Draw the entire ship"""
-        self.draw_healing_laser()
-        super().draw()
+    def resolve_weapons(self):
+        """Fire the healing laser and then any other weapons"""
+        self.fire_healing_laser()
+        super().resolve_weapons()
 
-    def draw_healing_laser(self):
-        """Draw the mining lasers"""
+    def fire_healing_laser(self):
+        """Fire the healing laser (heals the healing target)"""
+        self.healing_beam = False
         if self.healing_target and force_utils.distance_between(self, self.healing_target) < self.p.laser_range:
 
             # Does my target need healing
             if self.healing_target.health_percent() < .99:
-                self.game_engine.draw_line(self.p.color, (self.x, self.y), (self.healing_target.x, self.healing_target.y),
-                                           width=self.p.laser_width + self.level)
                 self.healing_target.heal(self.p.laser_damage)
+                self.healing_beam = True
+
+    def draw(self):
+        """Draw the entire ship"""
+        self.draw_healing_laser()
+        super().draw()
+
+    def draw_healing_laser(self):
+        """Draw the healing laser (if we fired it)"""
+        if self.healing_beam:
+            self.game_engine.draw_line(self.p.color, (self.x, self.y), (self.healing_target.x, self.healing_target.y),
+                                       width=self.p.laser_width + self.level)
 
 
 # Simple test of the Healer functionality
@@ -7,6 +7,9 @@ from space_bots.ships import ship
 
 class Miner(ship.Ship):
     """Miner: A Miner ship in Space Bots"""
+    __slots__ = ('mining_asteroid', 'mining_yield', 'mining_announced', 'report_depleted')
+    avoidance = 3.0  # Miner really needs to avoid enemies
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -44,7 +47,6 @@ class Miner(ship.Ship):
 
         # General updates
         self.general_ship_updates()
-        self.general_avoidance(passive=3.0)  # Miner really needs to avoid enemies
 
         # Mining laser update
         self.laser_guns.update(self.mining_asteroid)
@@ -57,30 +59,27 @@ class Miner(ship.Ship):
 
         # Move toward the mining asteroid
         if self.mining_asteroid:
-            (_, _), (dx, dy) = force_utils.attraction_forces(self.mining_asteroid, self, self.p.laser_range/1.3)
-            self.force_x += dx
-            self.force_y += dy
-
-        # Let Squad know my Zenite Yield
-        self.squad.total_zenite += self.mining_yield
+            asteroid = self.mining_asteroid
+            force_utils.add_attraction(self.world.force_x, self.world.force_y, None, self.world_index,
+                                       asteroid.x, asteroid.y, self.x, self.y, self.p.laser_range/1.3)
 
         # Now actually call the move command (which uses force/mass calc)
         self.move()
 
-    def draw(self):
-        """Draw the entire ship"""
-        self.draw_mining_laser()
-        super().draw()
+    def resolve_weapons(self):
+        """Fire the mining lasers and then any other weapons"""
+        self.fire_mining_laser()
+        super().resolve_weapons()
 
-    def draw_mining_laser(self):
-        """Draw the mining lasers"""
-        self.laser_guns.draw(self.mining_asteroid)
+    def fire_mining_laser(self):
+        """Fire the mining lasers (extracting minerals from the asteroid)"""
         if self.mining_asteroid and force_utils.distance_between(self, self.mining_asteroid) < self.p.laser_range:
             self.laser_guns.fire(self.mining_asteroid)
 
             # Extract the minerals
             extracted = self.mining_asteroid.extract_minerals(self.p.laser_damage)
             self.mining_yield += extracted
+            self.squad.total_zenite += extracted
 
             # Report if asteroid depleted
             if extracted == 0:
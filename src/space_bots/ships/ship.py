@@ -1,4 +1,5 @@
 """Ship: Class for the ships in Space Bots"""
+import time
 from queue import SimpleQueue
 
 # Local Imports
@@ -9,6 +10,13 @@ from space_bots.ships import ship_parameters, ship_state
 
 class Ship(entity.Entity):
     """Ship: Class for the ships in Space Bots"""
+    # Note: Ships are slotted (lots of them and lots of attribute access), subclasses declare their extra fields
+    __slots__ = ('ship_type', 'level', 'p', 's', 'team', 'squad', 'battle_info', 'self_buffs', 'squad_buffs',
+                 'buff_manager', 'clock', 'first_strike', 'in_combat', 'dead', 'low_health_announced',
+                 'death_announced', 'damage_done', 'damage_taken', 'laser_guns', 'torp_launcher', 'announcer_messages')
+    avoidance = 1.0  # Avoidance multiplier, the squad pushes ships away from adversaries within keep_range (None = no avoidance)
+    sprite_steps = 16  # Hull/Shield colors are quantized into this many steps (keeps the set of sprites small)
+
     def __init__(self, game_engine, x=500, y=500, ship_type='fighter', level=1):
 
         # Set my Ship Parameters and State
@@ -55,6 +63,7 @@ class Ship(entity.Entity):
         self.self_buffs = []
         self.squad_buffs = []
         self.buff_manager = None
+        self.clock = time  # Wall-clock until the Universe gives us the simulation clock
 
         # Combat indicators
         self.first_strike = False
@@ -80,12 +89,19 @@ class Ship(entity.Entity):
     def set_battle_info(self, battle_info):
         self.battle_info = battle_info
 
+    def set_clock(self, clock):
+        self.clock = clock
+
+    def set_torp_pool(self, torp_pool):
+        """Torp Launchers share the Universe TorpPool"""
+        self.torp_launcher.set_pool(torp_pool)
+
     def squad_in_combat(self):
         return self.squad.in_combat if self.squad else False
 
     def pre_delete(self):
         """All Entities have a pre_delete method where they might take some action/set stuff before being deleted"""
-        pass
+        self.torp_launcher.pre_delete()
 
     def within_range(self, target):
         """Is this target within weapons range"""
@@ -97,6 +113,8 @@ class Ship(entity.Entity):
         # Damage modifiers
         points *= self.p.incoming_damage_modifier
         self.damage_taken += points
+        if self.squad:
+            self.squad.total_damage += points
 
         # Shield Damage
         if points < self.s.shield:
@@ -205,18 +223,10 @@ class Ship(entity.Entity):
 
         # Zerg have 0 range
         ship_range = 0 if self.team == 'zerg' else self.p.laser_range/1.3
-        if self.squad.main_target:
-            (dx, dy), (_, _) = force_utils.attraction_forces(self, self.squad.main_target, ship_range)
-            self.force_x += dx * aggressive
-            self.force_y += dy * aggressive
-
-    def general_avoidance(self, passive=1.0):
-        """Avoidance Logic that's useful for most ships"""
-        passive *= 0.01
-        for enemy_ship in self.squad.adversaries:
-            (dx, dy), (_, _) = force_utils.repulsion_forces(self, enemy_ship, rest_distance=self.p.keep_range)
-            self.force_x += dx * passive * enemy_ship.mass
-            self.force_y += dy * passive * enemy_ship.mass
+        target = self.squad.main_target
+        if target:
+            force_utils.add_attraction(self.world.force_x, self.world.force_y, self.world_index, None,
+                                       self.x, self.y, target.x, target.y, ship_range, s_scale=aggressive)
 
     def update(self):
         """Update the Ship"""
@@ -224,69 +234,94 @@ class Ship(entity.Entity):
         # General updates
         self.general_ship_updates()
         self.general_targeting()
-        self.general_avoidance()
         self.general_target_movement()
 
         # Now actually call the move command
         self.move()
 
+    def resolve_weapons(self):
+        """Fire the weapons (damage, healing, mining, torp release all happen here, NOT in draw)"""
+        self.laser_guns.fire(self.s.target)
+        self.torp_launcher.fire(self.squad.main_target)
+
     def draw(self):
         """Draw the ship, weapons, shields..."""
 
-        # Weapons will both drawn and fired
+        # Weapons (purely visual, the firing happened in resolve_weapons)
         self.laser_guns.draw(self.s.target)
-        self.laser_guns.fire(self.s.target)
         self.torp_launcher.draw(self.squad.main_target)
-        self.torp_launcher.fire(self.squad.main_target)
 
-        # Ship Stuff
+        # Ship Stuff (ship icon, health indicator, level pips, and shield are one pre-rendered sprite)
         self.draw_buffs()
-        self.draw_ship()
-        self.draw_shield()
+        self.game_engine.draw_sprite(self.sprite_key(), (self.x, self.y), self.sprite_radius(), self.render_sprite)
 
-    def draw_ship(self):
-        """Draw the Ship Icon"""
+    def sprite_key(self):
+        """Key for the pre-rendered sprite: (ship_type, level, team, hull step, shield step, health indicator)"""
         hull_health = min(self.s.hp / self.p.hp + 0.6, 1.0)
+        shield_health = min(220 * self.s.shield / self.p.shield + 35, 255)
+        return (self.ship_type, self.level, self.team, round(hull_health * self.sprite_steps),
+                round(shield_health / 255 * self.sprite_steps), self.health_indicator())
+
+    def sprite_radius(self):
+        """Half the size of the sprite (the level pips stick out past the shield)"""
+        if self.level > 1 and self.ship_type not in ['drone', 'zergling']:
+            return self.p.shield_radius + 5 * self.level + 1
+        return self.p.shield_radius + 1
+
+    def health_indicator(self):
+        """Color of the health indicator (None when the ship is healthy)"""
+        health_percent = self.health_percent()
+        if health_percent < 0.2:  # critical_health()
+            return 240, 20, 20
+        elif health_percent < 0.35:  # low_health()
+            return 220, 110, 20
+        elif health_percent < 0.5:  # medium_health()
+            return 200, 200, 20
+        elif health_percent < 0.7:
+            return 100, 100, 10
+        return None
+
+    def render_sprite(self, key, draw_circle, center):
+        """Render the sprite for the given key (only called when the sprite isn't already cached)
+           Args:
+               key: The sprite key (see sprite_key())
+               draw_circle: Function with the same signature as game_engine.draw_circle() that draws on the sprite
+               center: Center of the ship on the sprite
+        """
+        self.draw_ship(key, draw_circle, center)
+        self.draw_shield(key, draw_circle, center)
+
+    def draw_ship(self, key, draw_circle, center):
+        """Draw the Ship Icon"""
+        x, y = center
+        hull_health = key[3] / self.sprite_steps
         hull_color = (self.p.color[0] * hull_health, self.p.color[1] * hull_health, self.p.color[2] * hull_health)
-        self.game_engine.draw_circle((30, 30, 30), (self.x, self.y), self.p.radius, width=0)
-        self.game_engine.draw_circle(hull_color, (self.x, self.y), self.p.radius, width=self.p.ship_width)
+        draw_circle((30, 30, 30), center, self.p.radius, width=0)
+        draw_circle(hull_color, center, self.p.radius, width=self.p.ship_width)
 
         # Health Indicator
-        width = 1 if self.ship_type in ['scout', 'zergling'] else 0
-        health_indicator_radius = int(max(self.p.radius/3, 3))
-        if self.critical_health():
-            self.game_engine.draw_circle((240, 20, 20), (self.x, self.y), health_indicator_radius, width=width)
-        elif self.low_health():
-            self.game_engine.draw_circle((220, 110, 20), (self.x, self.y), health_indicator_radius, width=width)
-        elif self.medium_health():
-            self.game_engine.draw_circle((200, 200, 20), (self.x, self.y), health_indicator_radius, width=width)
-        elif self.health_percent() < 0.7:
-            self.game_engine.draw_circle((100, 100, 10), (self.x, self.y), health_indicator_radius, width=width)
+        health_indicator = key[5]
+        if health_indicator:
+            width = 1 if self.ship_type in ['scout', 'zergling'] else 0
+            draw_circle(health_indicator, center, int(max(self.p.radius/3, 3)), width=width)
 
         # Level Pips
         if self.ship_type not in ['drone', 'zergling']:
-            pip_x = self.x + self.p.shield_radius
-            pip_y = self.y - self.p.shield_radius
+            pip_x = x + self.p.shield_radius
+            pip_y = y - self.p.shield_radius
             if self.level > 1:
                 for _ in range(self.level):
-                    self.game_engine.draw_circle(self.p.color, (pip_x, pip_y), 3, width=0)
+                    draw_circle(self.p.color, (pip_x, pip_y), 3, width=0)
                     pip_x += 5
 
-    def get_torps(self):
-        """Return the LIVE Torps from the Launcher"""
-        if hasattr(self.torp_launcher, 'live_torps'):
-            return self.torp_launcher.live_torps()
-        else:
-            return []
-
-    def draw_shield(self):
+    def draw_shield(self, key, draw_circle, center):
         """Draw the Shield"""
-        shield_health = min(220 * self.s.shield / self.p.shield + 35, 255)
+        shield_health = min(key[4] / self.sprite_steps * 255, 255)
         if self.team == 'zerg':
             shield_color = (shield_health/2, shield_health/2, shield_health/2)
         else:
             shield_color = (shield_health, shield_health, shield_health)
-        self.game_engine.draw_circle(shield_color, (self.x, self.y), self.p.shield_radius, width=self.p.shield_width)
+        draw_circle(shield_color, center, self.p.shield_radius, width=self.p.shield_width)
 
     def add_buff(self, buff, **kwargs):
         """Any buff goes to the buff manager who manages the application and expiration of buffs"""
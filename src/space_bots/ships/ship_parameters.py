@@ -6,6 +6,12 @@ from space_bots.ships.specs.ship_catalog import ship_specs
 
 class ShipParameters:
     """ShipParameters: Class for setting up a Ship Parameters (what it is)"""
+    __slots__ = ('ship_type', 'color', 'mass', 'speed', 'radius', 'hp', 'shield', 'laser_range', 'laser_damage',
+                 'laser_width', 'laser_heat', 'capacitor', 'shield_recharge', 'hull_recharge', 'cap_recharge',
+                 'ship_width', 'shield_width', 'keep_range', 'threat', 'incoming_damage_modifier',
+                 'outgoing_damage_modifier', 'targeting_lock_avoidance', 'max_torps', 'shield_radius',
+                 'collision_radius')
+
     def __init__(self, ship_type):
         """Set up all the various ship parameters"""
         self.ship_type = ship_type
@@ -6,6 +6,8 @@ from space_bots.ships.specs.ship_catalog import ship_specs
 
 class ShipState:
     """ShipState: Class for Managing all the Ship State"""
+    __slots__ = ('hp', 'shield', 'capacitor', 'target', 'nearest_adversary')
+
     def __init__(self, ship_type):
         """Set up the ship state"""
         self.hp = ship_specs[ship_type]['hp']
@@ -14,3 +16,4 @@ class ShipState:
 
         # Targeting
         self.target = None
+        self.nearest_adversary = None  # Set by the squad each tick (see Squad.assign_nearest_adversaries)
@@ -7,6 +7,9 @@ from space_bots.ships import ship
 
 class Tank(ship.Ship):
     """Tank: A Tank ship in Space Bots"""
+    __slots__ = ('protect_target', 'shield_thrown', 'iron_will_thrown')
+    avoidance = None  # Tanks take the hits
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -6,6 +6,9 @@ from space_bots.ships import ship
 
 class Zergling(ship.Ship):
     """Zergling: A Zergling ship in Space Bots"""
+    __slots__ = ('protect_asset',)
+    avoidance = None  # Zerglings just charge
+
     def __init__(self, game_engine, x=300, y=300, level=1):
 
         # Call SuperClass (Entity) Initialization
@@ -1,6 +1,8 @@
 """SoundPlayer: Class for Managing/Playing Sound/Music in Space Bots"""
 from os import walk, path
 from random import choice
+from collections import OrderedDict
+import threading
 import queue
 
 import pygame
@@ -10,7 +12,11 @@ from space_bots.utils.sound_limiter import SoundLimiter
 
 
 class SoundPlayer:
-    """SoundPlayer: Class for Managing/Playing Sound/Music in Space Bots"""
+    """SoundPlayer: Class for Managing/Playing Sound/Music in Space Bots
+       Note: Sound clips are indexed at startup but only decoded on first use (or prefetch())
+    """
+    max_clips = 32  # Decoded clips we keep around (least recently played get dropped)
+
     def __init__(self):
 
         # Set up our sound limiter (avoids spamming sounds too close together)
@@ -28,35 +34,32 @@ class SoundPlayer:
             file_tag = path.splitext(music_file)[0]
             self.music_tracks[file_tag] = path.join(music_location, music_file)
 
-        # Randomly pick one
+        # Randomly pick one (it's loaded when the music starts playing)
         self.current_background_track = choice(list(self.music_tracks.keys()))
-        self.mixer.music.load(self.music_tracks[self.current_background_track])
-        self.mixer.music.set_volume(0.3)  # Background should be a bit lower volume
 
-        # Load up our sound files
+        # Index our sound files: clip_tag -> (file, volume)
         sound_location = path.join(path.dirname(__file__), 'sounds/interactive_sounds/')
-        self.sound_clips = {}
+        self.clip_files = {}
         for sound_file in next(walk(sound_location), (None, None, []))[2]:
             clip_tag = path.splitext(sound_file)[0]
-            self.sound_clips[clip_tag] = self.mixer.Sound(path.join(sound_location, sound_file))
             # Special case for lasers
-            if clip_tag == 'laser':
-                self.sound_clips[clip_tag].set_volume(0.1)
-            else:
-                self.sound_clips[clip_tag].set_volume(0.3)
+            volume = 0.1 if clip_tag == 'laser' else 0.3
+            self.clip_files[clip_tag] = (path.join(sound_location, sound_file), volume)
 
-        # Load up our voice-over files
+        # Index our voice-over files
         sound_location = path.join(path.dirname(__file__), 'sounds/voice_overs/')
         for sound_file in next(walk(sound_location), (None, None, []))[2]:
             # Ignore
             if sound_file == '.DS_Store':
                 continue
             clip_tag = path.splitext(sound_file)[0]
-            self.sound_clips[clip_tag] = self.mixer.Sound(path.join(sound_location, sound_file))
-            self.sound_clips[clip_tag].set_volume(1.0)
             # Special case for power_cords
-            if 'power_cord' in clip_tag:
-                self.sound_clips[clip_tag].set_volume(0.5)
+            volume = 0.5 if 'power_cord' in clip_tag else 1.0
+            self.clip_files[clip_tag] = (path.join(sound_location, sound_file), volume)
+
+        # Decoded clips (LRU), the prefetch thread adds to this so it's behind a lock
+        self.sound_clips = OrderedDict()
+        self.clip_lock = threading.Lock()
 
         # FIXME: Hardcoded limits for now
         self.sound_limiter.add_limit('laser', 0.05)
@@ -65,8 +68,62 @@ class SoundPlayer:
 
     def play_background_music(self, mix='default'):
         """Play some Background Music"""
+        self.mixer.music.load(self.music_tracks[self.current_background_track])
+        self.mixer.music.set_volume(0.3)  # Background should be a bit lower volume
         self.mixer.music.play(-1)
 
+    def get_clip(self, clip_tag):
+        """Get the decoded sound clip (decodes the file the first time it's asked for)"""
+        with self.clip_lock:
+            clip = self.sound_clips.get(clip_tag)
+            if clip is not None:
+                self.sound_clips.move_to_end(clip_tag)
+                return clip
+
+        # Decode outside the lock (the prefetch thread might be decoding something else)
+        sound_file, volume = self.clip_files[clip_tag]
+        clip = self.mixer.Sound(sound_file)
+        clip.set_volume(volume)
+        with self.clip_lock:
+            self.sound_clips[clip_tag] = clip
+            self._evict_clips()
+        return clip
+
+    def _evict_clips(self):
+        """Internal: Drop the least recently played clips that aren't playing right now (call with clip_lock held)
+           Note: If everything is still playing we go over max_clips for a bit, the next get_clip() catches up
+        """
+        for clip_tag in list(self.sound_clips):
+            if len(self.sound_clips) <= self.max_clips:
+                return
+            if self.sound_clips[clip_tag].get_num_channels() == 0:
+                del self.sound_clips[clip_tag]
+
+    def prefetch(self, clip_tags, background=True):
+        """Decode the clips ahead of time (a tag also matches its announcer versions, e.g. tank_low_male)
+           Args:
+               clip_tags: List of clip tags we'll probably need
+               background: Decode on a background thread
+           Returns:
+               Thread: The prefetch thread (None if background is False)
+        """
+        clip_tags = [tag for tag in self.clip_files if any(tag == c or tag.startswith(c + '_') for c in clip_tags)]
+        clip_tags = clip_tags[:self.max_clips]
+        if not background:
+            self._decode_clips(clip_tags)
+            return None
+        thread = threading.Thread(target=self._decode_clips, args=(clip_tags,), daemon=True)
+        thread.start()
+        return thread
+
+    def _decode_clips(self, clip_tags):
+        """Internal: Decode the clips (stops quietly if the mixer shuts down underneath a background prefetch)"""
+        try:
+            for clip_tag in clip_tags:
+                self.get_clip(clip_tag)
+        except pygame.error:
+            pass
+
     def stop_background(self):
         """Stop the Background Music"""
         self.mixer.music.stop()
@@ -76,7 +133,7 @@ class SoundPlayer:
         # Note: This queues the sound and calls the internal play sound
 
         # Do we actually have this sound?
-        if sound_name not in self.sound_clips:
+        if sound_name not in self.clip_files:
             print(f'Sound: {sound_name} not found...')
             return
 
@@ -99,7 +156,7 @@ class SoundPlayer:
 
             # Grab next sound off queue and play it
             next_sound, busy_wait = self.sound_queue.get()
-            self.sound_clips[next_sound].play()
+            self.get_clip(next_sound).play()
 
     def announce(self, voice_line, announcer='random'):
         """Have the announcer say stuff"""
@@ -131,6 +188,19 @@ def test():
     # Create a Sound Adapter class and test some stuff out
     my_sound = SoundPlayer()
 
+    # Nothing is decoded until we need it
+    assert my_sound.clip_files and not my_sound.sound_clips
+    my_sound.prefetch(['tank_low', 'laser']).join()
+    assert set(my_sound.sound_clips) == {'tank_low_male', 'tank_low_female', 'laser'}
+
+    # A clip that's still playing isn't evicted (the least recently played idle clip goes instead)
+    oldest, *idle = my_sound.sound_clips
+    my_sound.sound_clips[oldest].play()
+    my_sound.max_clips = 3
+    my_sound.get_clip('explosion')
+    assert list(my_sound.sound_clips) == [oldest] + idle[1:] + ['explosion']
+    del my_sound.max_clips
+
     # Level Tests
     sleep(1.1)
     my_sound.announce('uff', None)
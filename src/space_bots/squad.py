@@ -6,12 +6,12 @@
 #     - Stance/Positioning Strategy
 #     - etc...
 from random import choice
-import statistics
+import heapq
 import math
 from queue import SimpleQueue
 
 # Local Imports
-from space_bots.utils import force_utils
+from space_bots.utils import force_utils, force_kernels
 
 
 class Squad:
@@ -36,9 +36,9 @@ class Squad:
 
         # Keep info/stats on my adversaries (populated in update)
         self.adversaries = None
+        self._adversary_set = set()
         self.ship_health = None
         self.ship_distance = None
-        self.ship_mass = None
         self.ship_threat = None
 
         # Communications Message Queues
@@ -60,7 +60,7 @@ class Squad:
         self.first_combat = True
         self.combat_timer = 0
         self.combat_status_change = False
-        self.total_zenite = 0
+        self.total_zenite = 0  # Running totals over the living ships (ships/miners add to these as it happens)
         self.total_damage = 0
         self.buff_manager = None
         self.asteroids = None
@@ -71,6 +71,15 @@ class Squad:
         ship.squad = self
         ship.battle_info = self.battle_info
         self.ships.append(ship)
+        self.total_zenite += getattr(ship, 'mining_yield', 0)
+        self.total_damage += ship.damage_taken
+
+    def remove_ship(self, ship):
+        """Remove a (dead) Ship from this Squad"""
+        ship.pre_delete()
+        self.ships.remove(ship)
+        self.total_zenite -= getattr(ship, 'mining_yield', 0)
+        self.total_damage -= ship.damage_taken
 
     def all_dead(self):
         """Are all the ships in this Squad dead?"""
@@ -82,7 +91,7 @@ class Squad:
 
     def average_health(self):
         """What's the average/mean health of all the ships in the Squad"""
-        return statistics.fmean([s.health_percent() for s in self.ships])
+        return math.fsum(s.health_percent() for s in self.ships) / len(self.ships)
 
     def set_battle_info(self, battle_info):
         """Someone has given us battle info/reconnaissance"""
@@ -98,12 +107,24 @@ class Squad:
         for ship in self.ships:
             ship.pre_delete()
         self.ships = []
+        self.total_zenite = 0
+        self.total_damage = 0
 
     def set_buff_manager(self, buffs):
         self.buff_manager = buffs
         for ship in self.ships:
             ship.buff_manager = buffs
 
+    def set_clock(self, clock):
+        """Give the Squad (and all its ships) the simulation clock"""
+        for ship in self.ships:
+            ship.set_clock(clock)
+
+    def set_torp_pool(self, torp_pool):
+        """Give the Squad (and all its ships) the Universe TorpPool"""
+        for ship in self.ships:
+            ship.set_torp_pool(torp_pool)
+
     def get_buffed(self):
         """Now setup/add buffs for the entire squad"""
 
@@ -191,20 +212,27 @@ class Squad:
         # Remove any dead ships
         for ship in self.ships.copy():  # Copy so we can remove from actual list
             if ship.is_dead():
-                ship.pre_delete()
-                self.ships.remove(ship)
+                self.remove_ship(ship)
 
         # Are any of my ships in combat?
-        self.set_combat_status(any([s.in_combat for s in self.ships]))
+        self.set_combat_status(any(s.in_combat for s in self.ships))
 
         # Get my adversaries
         self.adversaries = self.battle_info.adversary_ships(self)
+        self._adversary_set = set(self.adversaries)
 
-        # Compute health, mass, and threat
-        self.ship_health = self.lowest_health()
-        self.ship_distance = self.distance_from_squad()
-        self.ship_mass = self.highest_mass()
-        self.ship_threat = self.highest_threat()  # FIXME: Priority targeting is bugged a bit
+        # Rank the adversaries (only the top-k that the active target strategy needs)
+        self.ship_health = self.ship_distance = self.ship_threat = None
+        if self.target_strategy == 'low_health':
+            self.ship_health = self.lowest_health(k=4)  # Main target [0] and secondary targets [1:4]
+        elif self.target_strategy == 'nearest':
+            self.ship_distance = self.nearest_adversaries(self)
+        elif self.target_strategy == 'threat':
+            self.ship_threat = self.highest_threat(k=1)  # FIXME: Priority targeting is bugged a bit
+
+        # Nearest/Threat ships use their nearest adversary as the secondary target
+        if self.target_strategy in ('nearest', 'threat'):
+            self.assign_nearest_adversaries()
 
         # Compute information about the squad
         self.x, self.y = self.compute_centroid()
@@ -214,25 +242,23 @@ class Squad:
         group_ships = [s for s in self.ships if s.ship_type not in ['zergling', 'drone']]
         squad_radius = 60 + len(group_ships) * 10
         for _ship in self.ships:
-            (_, _), (dx, dy) = force_utils.attraction_forces(self, _ship, squad_radius)
-            _ship.force_x += dx * .75
-            _ship.force_y += dy * .75
+            force_utils.add_attraction(_ship.world.force_x, _ship.world.force_y, None, _ship.world_index,
+                                       self.x, self.y, _ship.x, _ship.y, squad_radius, t_scale=.75)
 
         # Protecting an Asset
         if self.protection_asset:
+            asset = self.protection_asset
             for _ship in self.ships:
-                (_, _), (dx, dy) = force_utils.attraction_forces(self.protection_asset, _ship, self.protection_distance)
-                _ship.force_x += dx * .5
-                _ship.force_y += dy * .5
+                force_utils.add_attraction(_ship.world.force_x, _ship.world.force_y, None, _ship.world_index,
+                                           asset.x, asset.y, _ship.x, _ship.y, self.protection_distance, t_scale=.5)
+
+        # Avoidance (batched for the whole squad)
+        self.apply_avoidance()
 
         # Update each ship
         for _ship in self.ships:
             _ship.update()
 
-        # How ZeNite extracted and Damage Taken (Repairs)
-        self.total_zenite = sum([m.mining_yield for m in self.ships if m.ship_type == 'miner'])
-        self.total_damage = sum([s.damage_taken for s in self.ships])
-
     def draw(self):
         """Draw the entire squad"""
         for _ship in self.ships:
@@ -242,24 +268,36 @@ class Squad:
         if not self.ships:
             return 0, 0
         if not mass_based:
-            x_centroid = statistics.fmean([s.x for s in self.ships])
-            y_centroid = statistics.fmean([s.y for s in self.ships])
+            x_centroid = math.fsum(s.x for s in self.ships) / len(self.ships)
+            y_centroid = math.fsum(s.y for s in self.ships) / len(self.ships)
             return x_centroid, y_centroid
         else:
-            total_mass = sum([s.mass for s in self.ships])
-            x_centroid = sum([s.x * s.mass for s in self.ships])
-            y_centroid = sum([s.y * s.mass for s in self.ships])
+            # One pass over the ships (no temporary lists)
+            total_mass = x_centroid = y_centroid = 0
+            for s in self.ships:
+                mass = s.mass
+                total_mass += mass
+                x_centroid += s.x * mass
+                y_centroid += s.y * mass
             return x_centroid/total_mass, y_centroid/total_mass
 
-    def lowest_health(self):
-        ship_health = [(s, s.health()) for s in self.adversaries]
-        ship_health.sort(key=lambda tup: tup[1])
-        return [s[0] for s in ship_health]
+    @staticmethod
+    def _rank(ships, scores, k=None, reverse=False):
+        """Internal: Ships ordered by score (ties keep ship order), k=None for all of them or just the top-k"""
+        ship_scores = zip(ships, scores)
+        if k is None:
+            ship_scores = sorted(ship_scores, key=lambda tup: tup[1], reverse=reverse)
+        elif reverse:
+            ship_scores = heapq.nlargest(k, ship_scores, key=lambda tup: tup[1])
+        else:
+            ship_scores = heapq.nsmallest(k, ship_scores, key=lambda tup: tup[1])
+        return [s[0] for s in ship_scores]
 
-    def highest_mass(self):
-        ship_mass = [(s, s.mass) for s in self.adversaries]
-        ship_mass.sort(key=lambda tup: tup[1], reverse=True)
-        return [s[0] for s in ship_mass]
+    def lowest_health(self, k=None):
+        return self._rank(self.adversaries, [s.health() for s in self.adversaries], k)
+
+    def highest_mass(self, k=None):
+        return self._rank(self.adversaries, [s.mass for s in self.adversaries], k, reverse=True)
 
     def highest_minerals(self):
         asteroid_minerals = [(a, a.concentration) for a in self.asteroids]
@@ -279,30 +317,53 @@ class Squad:
         best = [a[0] for a in best_asteroid][0]  # Just returning the top asteroid
         return best if best.concentration else None
 
-    def highest_threat(self):
+    def highest_threat(self, k=None):
         """Combination of Distance and Threat"""
         _distance = [force_utils.distance_between(self, s) for s in self.adversaries]
-        ship_threat = [(s, s.p.threat/(d+50.0)) for s, d in zip(self.adversaries, _distance)]
-        ship_threat.sort(key=lambda tup: tup[1], reverse=True)
-        return [s[0] for s in ship_threat]
+        _threat = [s.p.threat/(d+50.0) for s, d in zip(self.adversaries, _distance)]
+        return self._rank(self.adversaries, _threat, k, reverse=True)
 
-    def highest_priority(self):
+    def highest_priority(self, k=None):
         """Combination of Distance, Threat, and Health"""
         _distance = [force_utils.distance_between(self, s) for s in self.adversaries]
         _health = [s.health_percent()*100.0+1 for s in self.adversaries]  # Avoid divide by zero
-        ship_threat = [(s, s.p.threat/((d+100)*h)) for s, d, h in zip(self.adversaries, _distance, _health)]
-        ship_threat.sort(key=lambda tup: tup[1], reverse=True)
-        return [s[0] for s in ship_threat]
+        _priority = [s.p.threat/((d+100)*h) for s, d, h in zip(self.adversaries, _distance, _health)]
+        return self._rank(self.adversaries, _priority, k, reverse=True)
 
-    def distance_from_squad(self):
-        squad_distance = [(s, force_utils.distance_between(self, s)) for s in self.adversaries]
-        squad_distance.sort(key=lambda tup: tup[1])
-        return [s[0] for s in squad_distance]
+    def distance_from_squad(self, k=None):
+        return self._rank(self.adversaries, [force_utils.distance_between(self, s) for s in self.adversaries], k)
 
-    def distance_from_ship(self, ship):
-        ship_distance = [(s, force_utils.distance_between(ship, s)) for s in self.adversaries]
-        ship_distance.sort(key=lambda tup: tup[1])
-        return [s[0] for s in ship_distance]
+    def apply_avoidance(self):
+        """Avoidance forces for all the ships in the squad (each ship has its own keep_range and avoidance)
+           Note: Candidates come from the BattleState spatial index, so only adversaries near keep range are tested
+        """
+        ships, enemies, passive = [], [], []
+        for ship in self.ships:
+            keep_range = ship.p.keep_range
+            if ship.avoidance is None or not keep_range:
+                continue
+            # Note: +1 on the query, the exact rest distance test is left to the force calculation
+            for enemy in self.battle_info.enemies_within(self.team, ship.x, ship.y, keep_range + 1):
+                if enemy in self._adversary_set:
+                    ships.append(ship)
+                    enemies.append(enemy)
+                    passive.append(ship.avoidance)
+        force_kernels.avoidance_forces(ships, enemies, passive)
+
+    def nearest_adversaries(self, source, k=1):
+        """The k nearest adversaries to the source (squad or ship), nearest first (uses the BattleState spatial index)"""
+        return self.battle_info.nearest_enemies(self.team, source.x, source.y, k, among=self._adversary_set)
+
+    def assign_nearest_adversaries(self):
+        """Batched nearest adversary for every ship in the squad (stored on ship.s.nearest_adversary)"""
+        if not self.adversaries:
+            nearest = [None] * len(self.ships)
+        elif force_kernels.have_numpy():
+            nearest = [self.adversaries[i] for i in force_kernels.nearest_indices(self.ships, self.adversaries)]
+        else:
+            nearest = [self.nearest_adversaries(ship)[0] for ship in self.ships]
+        for ship, target in zip(self.ships, nearest):
+            ship.s.nearest_adversary = target
 
     def _distance_centroid(self, target):
         dx = self.x - target.x
@@ -334,9 +395,9 @@ class Squad:
             if self.target_strategy == 'low_health':
                 return self.get_sticky_target(my_ship, self.ship_health[1:4])
             if self.target_strategy == 'nearest':
-                return self.distance_from_ship(my_ship)[0]
+                return my_ship.s.nearest_adversary
             if self.target_strategy == 'threat':
-                return self.distance_from_ship(my_ship)[0]
+                return my_ship.s.nearest_adversary
             if self.target_strategy == 'random':
                 return self.get_sticky_target(my_ship, self.adversaries)
             if self.target_strategy == 'no_target':
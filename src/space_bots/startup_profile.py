@@ -0,0 +1,123 @@
+"""StartupProfile: Where does the time go between launching Space Bots and the first frame?
+
+   Usage:
+        python -m space_bots.startup_profile --mission 18
+        python -m space_bots.startup_profile --mission 18 --headless
+"""
+import os
+import sys
+import time
+import argparse
+import importlib
+import contextlib
+
+# Note: Nothing from space_bots (or pygame) is imported up here, importing it is the first thing we time
+
+
+class PhaseTimer:
+    """PhaseTimer: Collects the wall clock time of each named phase (in order), plus any notes for the report"""
+    def __init__(self):
+        self.phases = []
+        self.notes = []
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def note(self, text):
+        """Add a line (e.g. the asset memory report) to the end of the report"""
+        self.notes.append(text)
+
+    def total(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def report(self):
+        """Per phase times (and the share of the total)"""
+        total = self.total() or 1.0
+        lines = [f'{name:>16}: {seconds*1000:8.1f} ms  {100*seconds/total:5.1f}%' for name, seconds in self.phases]
+        lines.append(f'{"total":>16}: {self.total()*1000:8.1f} ms')
+        lines += self.notes
+        return '\n'.join(lines)
+
+
+def profile_startup(mission=18, headless=False, test_squads=True, quiet=True):
+    """Time each startup phase: import, asset load, mission parse, and first frame
+       Args:
+           mission: The mission level
+           headless: Use the HeadlessEngineAdapter (no pygame at all)
+           test_squads: Add the mission test squads
+           quiet: Suppress all the printing the Universe does
+       Returns:
+           PhaseTimer: The phase timings
+    """
+    timer = PhaseTimer()
+    adapter_module = 'space_bots.headless_engine_adapter' if headless else 'space_bots.game_engine_adapter'
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull if quiet else sys.stdout):
+
+        # Import the simulation core and the engine adapter (pygame for the real thing)
+        with timer.phase('import core'):
+            universe_module = importlib.import_module('space_bots.universe')
+        with timer.phase('import engine'):
+            adapter_module = importlib.import_module(adapter_module)
+
+        # Engine start up (display, image assets, sound index)
+        universe = universe_module.Universe(announcements=False)
+        with timer.phase('asset load'):
+            if headless:
+                engine = adapter_module.HeadlessEngineAdapter(universe)
+            else:
+                engine = adapter_module.GameEngineAdapter(universe)
+            universe.set_game_engine(engine)
+
+        # Mission specs, asteroids, squads
+        with timer.phase('mission parse'):
+            universe.mission_planner.set_mission(mission, test_squads=test_squads)
+            universe.finalize()
+
+        # First simulation tick and frame
+        with timer.phase('first frame'):
+            universe.communicate()
+            universe.update()
+            engine.draw_frame()
+
+    # What the image cache is holding after the first frame
+    timer.note(engine.assets.memory_report())
+    return timer
+
+
+def main(argv=None):
+    """Startup Profile command line entry point"""
+    parser = argparse.ArgumentParser(description='Report where Space Bots startup time goes (per phase)')
+    parser.add_argument('--mission', type=int, default=18, help='The mission level')
+    parser.add_argument('--headless', action='store_true', help='Use the headless engine (no pygame)')
+    parser.add_argument('--no-test-squads', action='store_true', help="Don't add the mission test squads")
+    parser.add_argument('--verbose', action='store_true', help='Show all the Universe output')
+    args = parser.parse_args(argv)
+    timer = profile_startup(args.mission, args.headless, not args.no_test_squads, quiet=not args.verbose)
+    print(timer.report())
+
+
+# Simple test of the StartupProfile functionality
+def test():
+    """Test for StartupProfile functionality"""
+    import subprocess
+
+    # The simulation core doesn't need pygame (or numpy until it's used)
+    check = 'import sys, space_bots.universe; print("pygame" in sys.modules, "numpy" in sys.modules)'
+    output = subprocess.run([sys.executable, '-c', check], capture_output=True, text=True, check=True).stdout
+    assert output.split() == ['False', 'False']
+
+    # Headless profile has all the phases
+    timer = profile_startup(18, headless=True)
+    assert [name for name, _ in timer.phases] == ['import core', 'import engine', 'asset load',
+                                                  'mission parse', 'first frame']
+    assert timer.notes[0].startswith('Assets:')
+    print(timer.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 """Universe: Class that contains all the stuff"""
+import math
 import time
 import string
+import random
 from random import randint, choice
 
 # Local Imports
-from space_bots import comms, battle_state, mission_planner
+from space_bots import comms, battle_state, mission_planner, world_arrays
 from space_bots.squad import Squad
-from space_bots.utils import force_utils, buff_manager
+from space_bots.utils import force_utils, force_kernels, buff_manager, placement
+from space_bots.utils.sim_clock import SimClock
+from space_bots.utils.torp_pool import TorpPool
+from space_bots.utils.spatial_hash import SpatialHash
 
 
 class Universe:
@@ -15,8 +20,14 @@ class Universe:
     # Note: Maybe refactor/rethink how this class should be used later
     #      - Collision Detection should be a separate class
 
-    def __init__(self, width=1600, height=1000, announcements=True):
-        """Initialize the Universe class"""
+    def __init__(self, width=1600, height=1000, announcements=True, seed=None, dt=1.0/120):
+        """Initialize the Universe class
+           Args:
+               seed: Random seed (same seed + same mission = bit-for-bit replay)
+               dt: Fixed timestep for the simulation clock (seconds per tick)
+        """
+        if seed is not None:
+            random.seed(seed)
         self.game_engine = None
         self.announcements = announcements
         if announcements:
@@ -33,11 +44,19 @@ class Universe:
         self.left = self.pad
         self.right = self.width - self.pad
 
-        # Track asteroids, squads, ships, and torpedoes
+        # Positions/forces for all the entities (entities queue their moves and the world integrates them)
+        self.world = world_arrays.default_world()
+
+        # Track asteroids, squads, ships, and torpedoes (all the torps live in the pool)
         self.asteroids = []
         self.squads = []
         self.all_ships = []
-        self.torps = []
+        self.torp_pool = TorpPool()
+
+        # Spatial Grids used by collision detection (rebuilt every tick)
+        self.ship_grid = SpatialHash()
+        self.zerg_grid = SpatialHash()
+        self.asteroid_grid = SpatialHash()
 
         # Universe State vars
         self.is_finalized = False
@@ -47,12 +66,15 @@ class Universe:
         self.bottom_text = None
         self.squads_buffed = False
 
+        # Simulation Clock (advances a fixed timestep every update, no matter how fast we run)
+        self.clock = SimClock(dt)
+
         # Universal Battle Info and Buff Manager
         self.battle_info = battle_state.BattleState(self, scanner_range=1000)
-        self.buffs = buff_manager.BuffManager()
+        self.buffs = buff_manager.BuffManager(self.clock)
 
         # Communication Channels
-        self.comms = comms.Comms()
+        self.comms = comms.Comms(self.clock)
 
         # Mission Planner
         self.mission_planner = mission_planner.MissionPlanner(self)
@@ -63,10 +85,11 @@ class Universe:
 
         # We need a list of individual ships for collision detections
         self.all_ships = [ship for _squad in self.squads for ship in _squad.ships]
+        self.battle_info.invalidate()
 
         # Make sure all entities are in a reasonable starting position
         self._space_out_asteroids()
-        force_utils.resolve_coincident(self.all_ships)
+        placement.resolve_coincident(self.all_ships)
 
         # Mission Planner Finalize
         self.mission_planner.finalize()
@@ -99,11 +122,14 @@ class Universe:
         squad.game_engine = self.game_engine
         squad.set_battle_info(self.battle_info)
         squad.set_buff_manager(self.buffs)
-        force_utils.resolve_coincident(squad.ships)
+        squad.set_clock(self.clock)
+        squad.set_torp_pool(self.torp_pool)
+        placement.resolve_coincident(squad.ships)
 
         # Add the Squad and update the Universal State
         self.squads.append(squad)
         self.all_ships = [ship for _squad in self.squads for ship in _squad.ships]
+        self.battle_info.invalidate()
 
     @staticmethod
     def gen_squad_name():
@@ -118,7 +144,7 @@ class Universe:
         self.add_squad(squad)
 
     def in_combat(self):
-        return any([s.in_combat for s in self.squads])
+        return any(s.in_combat for s in self.squads)
 
     def buff_squads(self):
         self.game_engine.restricted_announce('power_cord_d', None)
@@ -180,11 +206,7 @@ class Universe:
         self.all_ships = []
         for squad in self.squads:
             self.all_ships += squad.ships
-
-        # Build a torpedo list from the ships
-        self.torps = []
-        for ship in self.all_ships:
-            self.torps += ship.get_torps()
+        self.battle_info.invalidate()
 
         # Now run collision detection
         self.collision_detection()
@@ -200,6 +222,17 @@ class Universe:
         for squad in self.squads:
             squad.update()
 
+        # Now move all the entities (one integrate step for everything that called move())
+        self.torp_pool.update(self.world)
+        self.world.integrate()
+        self.battle_info.positions_changed()
+
+        # Fire all the weapons (damage, healing, mining, and torp releases)
+        self.resolve_weapons()
+
+        # Advance the simulation clock
+        self.clock.tick()
+
         # Time Slow
         # time.sleep(self.time_slow)
         # self.time_slow *= .9
@@ -216,8 +249,13 @@ class Universe:
                 self.comms.announce('lost_match')
         """
 
+    def resolve_weapons(self):
+        """Let all the ships fire their weapons (all the gameplay effects happen here, not in draw)"""
+        for ship in self.all_ships:
+            ship.resolve_weapons()
+
     def draw(self):
-        """Let all the entities in the Universe draw themselves"""
+        """Let all the entities in the Universe draw themselves (purely visual)"""
 
         # Ships first
         for ship in self.all_ships:
@@ -241,44 +279,41 @@ class Universe:
     def collision_detection(self):
         """Detect if any entity is colliding with another entity"""
 
-        # Test for collisions between all entities in the Universe
-        # Note: This has lots of room for improvement (spacial hierarchies/etc)
+        # Bucket ships and asteroids into uniform grids so each phase only tests nearby candidates
+        # Note: The cell size covers the largest interaction distance (the two biggest pad radii)
+        zerg_ships = self.battle_info.zerg_ships()
+        cell_size = 2 * SpatialHash.max_pad_radius(self.all_ships, self.asteroids)
+        self.ship_grid.rebuild(self.all_ships, cell_size)
+        self.zerg_grid.rebuild(zerg_ships, cell_size)
+        self.asteroid_grid.rebuild(self.asteroids, cell_size)
 
         # First: Torps vs Zerg Ships
-        zerg_ships = self.battle_info.zerg_ships()
-        for torp in self.torps:
-            for ship in zerg_ships:
-                if force_utils.distance_between(torp, ship) < ship.p.collision_radius:
-                    torp.impact(ship)
-
-        # Second: Ships vs Ships
-        for index, ship in enumerate(self.all_ships):
-            for co_ship in self.all_ships[index+1:]:
-
-                # Compute any collision forces
-                ship_spacing = ship.pad_radius + co_ship.pad_radius
-                (dx, dy), (co_dx, co_dy) = force_utils.repulsion_forces(ship, co_ship, ship_spacing)
-                ship.force_x += dx * co_ship.mass/ship.mass
-                ship.force_y += dy * co_ship.mass/ship.mass
-                co_ship.force_x += co_dx * ship.mass/co_ship.mass
-                co_ship.force_y += co_dy * ship.mass/co_ship.mass
+        self.torp_collisions(zerg_ships)
+
+        # Second: Ships vs Ships (batched/vectorized when NumPy is available)
+        force_kernels.ship_repulsion(self.all_ships, self.ship_grid.candidate_pairs())
 
         # Third: Ships vs Asteroid
+        # Note: Forces go straight into the world force arrays (fast path, no force tuples)
+        asteroid_radius = max((a.collision_radius for a in self.asteroids), default=0)
         for ship in self.all_ships:
-            for asteroid in self.asteroids:
-                # Compute any collision forces
-                (dx, dy), (p_dx, p_dy) = force_utils.repulsion_forces(ship, asteroid)
-                ship.force_x += dx * 10  # Asteroids are big
-                ship.force_y += dy * 10
+            sx, sy = ship.x, ship.y
+            for index in self.asteroid_grid.query(sx, sy, ship.collision_radius + asteroid_radius):
+                # Compute any collision forces (asteroids are big)
+                asteroid = self.asteroids[index]
+                force_utils.add_repulsion(ship.world.force_x, ship.world.force_y, ship.world_index, None,
+                                          sx, sy, ship.mass, asteroid.x, asteroid.y, asteroid.mass,
+                                          ship.collision_radius + asteroid.collision_radius, s_scale=10)
 
         # Fourth: Asteroid vs Asteroid
-        for index, asteroid in enumerate(self.asteroids):
-            for co_asteroid in self.asteroids[index+1:]:
-                (dx, dy), (co_dx, co_dy) = force_utils.repulsion_forces(asteroid, co_asteroid)
-                asteroid.force_x += dx * 10
-                asteroid.force_y += dy * 10
-                co_asteroid.force_x += co_dx * 10
-                co_asteroid.force_y += co_dy * 10
+        world = self.world
+        for index, co_index in self.asteroid_grid.candidate_pairs():
+            asteroid = self.asteroids[index]
+            co_asteroid = self.asteroids[co_index]
+            force_utils.add_repulsion(world.force_x, world.force_y, asteroid.world_index, co_asteroid.world_index,
+                                      asteroid.x, asteroid.y, asteroid.mass, co_asteroid.x, co_asteroid.y,
+                                      co_asteroid.mass, asteroid.collision_radius + co_asteroid.collision_radius,
+                                      s_scale=10, t_scale=10)
 
         # Fifth: Ships against boundaries (bounce effect)
         for _ship in self.all_ships:
@@ -294,29 +329,34 @@ class Universe:
             if asteroid.y < self.top or asteroid.y > self.bottom:
                 asteroid.force_y = -asteroid.force_y
 
+    def torp_collisions(self, zerg_ships):
+        """Projectile collision stage: the path each torp took last tick (swept) vs the nearby zerg ships
+           Note: Swept so fast torps can't tunnel through small ships (zerglings) between ticks
+        """
+        hit_radius = max((s.p.collision_radius for s in zerg_ships), default=0)
+        for torp, x0, y0, x1, y1 in self.torp_pool.live_sweeps(self.world):
+            # Broad phase: zerg grid cells around the torp path
+            half_length = 0.5 * math.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2)
+            candidates = self.zerg_grid.query((x0 + x1) * 0.5, (y0 + y1) * 0.5, half_length + hit_radius)
+
+            # Swept test: the torp hits the first ship along its path
+            hit_ship, hit_t = None, None
+            for index in candidates:
+                ship = zerg_ships[index]
+                t, distance = force_utils.segment_closest_approach(x0, y0, x1, y1, ship.x, ship.y)
+                if distance < ship.p.collision_radius and (hit_ship is None or t < hit_t):
+                    hit_ship, hit_t = ship, t
+            if hit_ship:
+                torp.impact(hit_ship)
+
     def _space_out_asteroids(self):
         """Make sure asteroids don't overlap"""
 
         # First resolve any coincident asteroids
-        force_utils.resolve_coincident(self.asteroids)
-
-        # Now Space out the asteroids
-        for _ in range(50):
-            for _asteroid in self.asteroids:
-                for co_asteroid in self.asteroids:
-                    # Skip self
-                    if _asteroid == co_asteroid:
-                        continue
-                    # Move if too close
-                    if force_utils.distance_between(_asteroid, co_asteroid) < 300:
-                        (dx, dy), (co_dx, co_dy) = force_utils.normalized_distance_vectors(_asteroid, co_asteroid)
-                        _asteroid.x -= dx * 5
-                        _asteroid.y -= dy * 5
-                        co_asteroid.x -= co_dx * 5
-                        co_asteroid.y -= co_dy * 5
-                    # Boundaries
-                    _asteroid.x = max(min(_asteroid.x, self.right), self.left)
-                    _asteroid.y = max(min(_asteroid.y, self.bottom), self.top)
+        placement.resolve_coincident(self.asteroids)
+
+        # Now Space out the asteroids (close pairs come from a grid, not every pair)
+        placement.space_out(self.asteroids, 300, (self.left, self.top, self.right, self.bottom))
 
 
 # Simple test of the Universe functionality
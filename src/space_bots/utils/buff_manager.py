@@ -14,8 +14,12 @@ class BuffManager:
             buffs.update()  # Check buffs/timers and remove when expired
             buffs.clear()   # Clear all buffs from all ships
     """
-    def __init__(self):
-        """BuffManager Initialization"""
+    def __init__(self, clock=None):
+        """BuffManager Initialization
+           Args:
+               clock: Anything with a time() method (e.g. SimClock), defaults to wall-clock time
+        """
+        self.clock = clock or time
         self._buff_info = ship_buffs.ship_buffs
         self.ship_buffs = defaultdict(dict)
 
@@ -30,7 +34,7 @@ class BuffManager:
         """
         # Record the expiration time
         if self._buff_info[buff_name].get('timer'):
-            expire = time.time() + self._buff_info[buff_name]['timer']
+            expire = self.clock.time() + self._buff_info[buff_name]['timer']
         else:
             expire = None
         my_buff_info = self._buff_info[buff_name].copy()
@@ -74,7 +78,7 @@ class BuffManager:
 
     def update(self):
         """Check all the current buffs for expirations"""
-        now = time.time()
+        now = self.clock.time()
         for ship, all_buffs in self.ship_buffs.items():
             for buff_name in list(all_buffs.keys()):
                 if all_buffs[buff_name]['expire'] and all_buffs[buff_name]['expire'] < now:
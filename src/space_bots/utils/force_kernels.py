@@ -0,0 +1,282 @@
+"""ForceKernels: Batched (NumPy) versions of the ForceUtils calculations for lots of space_bot Entities"""
+
+# Local Imports
+from space_bots.utils.lazy_import import lazy_import
+from space_bots.utils import force_utils
+
+# NumPy is optional (imported on first use), if it's not installed we fall back to the pure-Python ForceUtils
+np = lazy_import('numpy')
+
+# Below this many pairs the NumPy call overhead costs more than the scalar loop
+MIN_BATCH_PAIRS = 32
+
+
+def have_numpy():
+    """Are the vectorized (NumPy) kernels available?"""
+    return np is not None
+
+
+def repulsion_kernel(x, y, mass, pad_radius, force_x, force_y, pairs=None):
+    """Vectorized TWO body repulsion for many pairs, forces are scatter-added into force_x/force_y (in place)
+       Args:
+           x, y: Position arrays
+           mass: Mass array
+           pad_radius: Pad radius array (rest distance for a pair is the sum of the two pad radii)
+           force_x, force_y: Force accumulators (float64 arrays, modified in place)
+           pairs: Optional (k, 2) array of index pairs (i < j), defaults to ALL pairs
+       Note: This matches ForceUtils.repulsion_forces() plus the mass-ratio scaling that
+             Universe.collision_detection() applies, the math is done in the same order so
+             the results agree with the scalar path to within floating point rounding
+    """
+    if pairs is None:
+        ii, jj = np.triu_indices(len(x), 1)
+    else:
+        pairs = np.asarray(pairs, dtype=np.intp).reshape(-1, 2)
+        ii, jj = pairs[:, 0], pairs[:, 1]
+
+    # Distance between each pair and mask out the pairs that are 'resting' (or coincident)
+    dx = x[jj] - x[ii]
+    dy = y[jj] - y[ii]
+    cur_distance = np.sqrt(dx ** 2 + dy ** 2)
+    mask = (cur_distance != 0) & (cur_distance <= pad_radius[ii] + pad_radius[jj])
+    if not mask.any():
+        return
+    ii, jj, dx, dy, cur_distance = ii[mask], jj[mask], dx[mask], dy[mask], cur_distance[mask]
+
+    # Repulsion will be greater the closer we are
+    repulsion_factor = 1000.0 / (cur_distance * cur_distance)
+    source_x = -(dx / cur_distance) * repulsion_factor
+    source_y = -(dy / cur_distance) * repulsion_factor
+    target_x = -source_x
+    target_y = -source_y
+
+    # Mass ratios (see ForceUtils.repulsion_forces)
+    source_mass = mass[ii]
+    target_mass = mass[jj]
+    t_s_ratio = target_mass / source_mass
+    s_t_ratio = source_mass / target_mass
+    source_x = source_x * t_s_ratio * s_t_ratio
+    source_y = source_y * t_s_ratio * s_t_ratio
+
+    # Scatter-add (interleaved so each entity accumulates in the same order as the double loop)
+    indices = np.empty(2 * len(ii), dtype=np.intp)
+    indices[0::2] = ii
+    indices[1::2] = jj
+    values = np.empty(2 * len(ii))
+    values[0::2] = source_x * target_mass / source_mass
+    values[1::2] = target_x * source_mass / target_mass
+    np.add.at(force_x, indices, values)
+    values[0::2] = source_y * target_mass / source_mass
+    values[1::2] = target_y * source_mass / target_mass
+    np.add.at(force_y, indices, values)
+
+
+def ship_repulsion(ships, pairs=None):
+    """Ship vs Ship repulsion forces (added into each ship's force_x/force_y)
+       Args:
+           ships: List of ships (or any object with x, y, mass, pad_radius, force_x, force_y)
+           pairs: Optional list of index pairs (i < j) to consider, defaults to ALL pairs
+    """
+    if len(ships) < 2 or (pairs is not None and not len(pairs)):
+        return
+    if np is None:
+        _ship_repulsion_python(ships, pairs)
+        return
+
+    # Ships backed by the WorldArrays: gather from (and scatter back into) the world arrays
+    world = getattr(ships[0], 'world', None)
+    if world is not None and all(s.world is world for s in ships):
+        view = world.numpy_views()
+        indices = np.fromiter((s.world_index for s in ships), dtype=np.intp, count=len(ships))
+        pad_radius = np.fromiter((s.pad_radius for s in ships), dtype=np.float64, count=len(ships))
+        force_x = view['force_x'][indices]
+        force_y = view['force_y'][indices]
+        repulsion_kernel(view['x'][indices], view['y'][indices], view['mass'][indices], pad_radius,
+                         force_x, force_y, pairs)
+        view['force_x'][indices] = force_x
+        view['force_y'][indices] = force_y
+        return
+
+    # Plain objects: gather the ship arrays, run the kernel, and write the forces back
+    x = np.fromiter((s.x for s in ships), dtype=np.float64, count=len(ships))
+    y = np.fromiter((s.y for s in ships), dtype=np.float64, count=len(ships))
+    mass = np.fromiter((s.mass for s in ships), dtype=np.float64, count=len(ships))
+    pad_radius = np.fromiter((s.pad_radius for s in ships), dtype=np.float64, count=len(ships))
+    force_x = np.fromiter((s.force_x for s in ships), dtype=np.float64, count=len(ships))
+    force_y = np.fromiter((s.force_y for s in ships), dtype=np.float64, count=len(ships))
+    repulsion_kernel(x, y, mass, pad_radius, force_x, force_y, pairs)
+    for ship, fx, fy in zip(ships, force_x.tolist(), force_y.tolist()):
+        ship.force_x = fx
+        ship.force_y = fy
+
+
+def avoidance_forces(ships, enemies, passive):
+    """Avoidance forces for many (ship, enemy) pairs, added into each ship's force_x/force_y
+       Args:
+           ships: List of ships, one per pair (a ship shows up once for each enemy it's avoiding)
+           enemies: List of enemy ships, one per pair
+           passive: List of avoidance multipliers, one per pair
+       Note: Each pair is a repulsion with the ship's keep_range as the rest distance and scaled by passive * 0.01 * enemy mass
+    """
+    if not ships:
+        return
+    world = ships[0].world
+    if np is None or len(ships) < MIN_BATCH_PAIRS or not all(s.world is world for s in ships + enemies):
+        _avoidance_python(ships, enemies, passive)
+        return
+
+    # Gather the pairs from the world arrays
+    view = world.numpy_views()
+    ii = np.fromiter((s.world_index for s in ships), dtype=np.intp, count=len(ships))
+    jj = np.fromiter((e.world_index for e in enemies), dtype=np.intp, count=len(enemies))
+    keep_range = np.fromiter((s.p.keep_range for s in ships), dtype=np.float64, count=len(ships))
+    scale = np.fromiter(passive, dtype=np.float64, count=len(passive)) * 0.01 * view['mass'][jj]
+
+    # Distance between each pair and mask out the pairs that are outside keep range (or coincident)
+    dx = view['x'][jj] - view['x'][ii]
+    dy = view['y'][jj] - view['y'][ii]
+    cur_distance = np.sqrt(dx ** 2 + dy ** 2)
+    mask = (cur_distance != 0) & (cur_distance <= keep_range)
+    if not mask.any():
+        return
+    ii, jj, dx, dy, cur_distance, scale = ii[mask], jj[mask], dx[mask], dy[mask], cur_distance[mask], scale[mask]
+
+    # Repulsion and mass ratios (see ForceUtils.repulsion_forces)
+    repulsion_factor = 1000.0 / (cur_distance * cur_distance)
+    ship_mass = view['mass'][ii]
+    enemy_mass = view['mass'][jj]
+    ratio = (enemy_mass / ship_mass) * (ship_mass / enemy_mass)
+    np.add.at(view['force_x'], ii, -(dx / cur_distance) * repulsion_factor * ratio * scale)
+    np.add.at(view['force_y'], ii, -(dy / cur_distance) * repulsion_factor * ratio * scale)
+
+
+def _avoidance_python(ships, enemies, passive):
+    """Internal: Pure-Python (scalar) avoidance forces"""
+    for ship, enemy, ship_passive in zip(ships, enemies, passive):
+        enemy_mass = enemy.mass
+        force_utils.add_repulsion(ship.world.force_x, ship.world.force_y, ship.world_index, None,
+                                  ship.x, ship.y, ship.mass, enemy.x, enemy.y, enemy_mass, ship.p.keep_range,
+                                  s_scale=ship_passive * 0.01 * enemy_mass)
+
+
+def nearest_indices(sources, targets):
+    """For each source, the index of the nearest target (ties go to the lower index)
+       Note: One sources x targets distance matrix and an argmin, so don't use this for huge lists
+       Args:
+           sources: List of entities (anything with x and y), e.g. the ships in a squad
+           targets: List of entities (anything with x and y), e.g. the squad adversaries
+       Returns:
+           list: Target index for each source (empty if there are no targets)
+    """
+    if not sources or not targets:
+        return []
+    if np is None:
+        return [min(range(len(targets)), key=lambda i: force_utils.distance_between(s, targets[i])) for s in sources]
+    source_x = np.fromiter((s.x for s in sources), dtype=np.float64, count=len(sources))
+    source_y = np.fromiter((s.y for s in sources), dtype=np.float64, count=len(sources))
+    target_x = np.fromiter((t.x for t in targets), dtype=np.float64, count=len(targets))
+    target_y = np.fromiter((t.y for t in targets), dtype=np.float64, count=len(targets))
+    distance = np.sqrt((target_x[None, :] - source_x[:, None]) ** 2 + (target_y[None, :] - source_y[:, None]) ** 2)
+    return np.argmin(distance, axis=1).tolist()
+
+
+def _ship_repulsion_python(ships, pairs=None):
+    """Internal: Pure-Python (scalar) ship vs ship repulsion"""
+    if pairs is None:
+        pairs = ((i, j) for i in range(len(ships)) for j in range(i+1, len(ships)))
+    for index, co_index in pairs:
+        ship = ships[index]
+        co_ship = ships[co_index]
+        ship_spacing = ship.pad_radius + co_ship.pad_radius
+        (dx, dy), (co_dx, co_dy) = force_utils.repulsion_forces(ship, co_ship, ship_spacing)
+        ship.force_x += dx * co_ship.mass/ship.mass
+        ship.force_y += dy * co_ship.mass/ship.mass
+        co_ship.force_x += co_dx * ship.mass/co_ship.mass
+        co_ship.force_y += co_dy * ship.mass/co_ship.mass
+
+
+# Simple test of the ForceKernels functionality
+def test():
+    """Test for ForceKernels: the vectorized kernel should match the scalar path"""
+    import math
+    from random import uniform, choice, seed
+
+    class FakeShip:
+        def __init__(self, x, y, pad_radius, mass):
+            self.x = x
+            self.y = y
+            self.pad_radius = pad_radius
+            self.collision_radius = pad_radius - 5
+            self.mass = mass
+            self.force_x = uniform(-1, 1)
+            self.force_y = uniform(-1, 1)
+
+    # A clump of ships (lots of overlaps) plus a couple of coincident ships
+    seed(7)
+    ships = [FakeShip(uniform(400, 600), uniform(400, 600), uniform(8, 30), choice([20, 100, 300, 600]))
+             for _ in range(120)]
+    ships.append(FakeShip(ships[0].x, ships[0].y, 10, 50))
+
+    def forces(_ships):
+        return [(s.force_x, s.force_y) for s in _ships]
+
+    def clone(_ships):
+        clones = []
+        for s in _ships:
+            c = FakeShip(s.x, s.y, s.pad_radius, s.mass)
+            c.force_x, c.force_y = s.force_x, s.force_y
+            clones.append(c)
+        return clones
+
+    # Scalar (reference) path
+    scalar_ships = clone(ships)
+    _ship_repulsion_python(scalar_ships)
+
+    # Batched path (NumPy if available)
+    batched_ships = clone(ships)
+    ship_repulsion(batched_ships)
+    for (sx, sy), (bx, by) in zip(forces(scalar_ships), forces(batched_ships)):
+        assert math.isclose(sx, bx, rel_tol=1e-12, abs_tol=1e-12)
+        assert math.isclose(sy, by, rel_tol=1e-12, abs_tol=1e-12)
+
+    # Batched path with a subset of candidate pairs
+    pairs = [(i, j) for i in range(0, len(ships), 3) for j in range(i+1, len(ships), 2)]
+    scalar_ships = clone(ships)
+    _ship_repulsion_python(scalar_ships, pairs)
+    batched_ships = clone(ships)
+    ship_repulsion(batched_ships, pairs)
+    for (sx, sy), (bx, by) in zip(forces(scalar_ships), forces(batched_ships)):
+        assert math.isclose(sx, bx, rel_tol=1e-12, abs_tol=1e-12)
+        assert math.isclose(sy, by, rel_tol=1e-12, abs_tol=1e-12)
+
+    # Nearest target for each source should match a brute force search
+    targets = ships[::4]
+    for s, index in zip(ships, nearest_indices(ships, targets)):
+        assert index == min(range(len(targets)), key=lambda i: force_utils.distance_between(s, targets[i]))
+    assert nearest_indices(ships, []) == []
+
+    # Batched avoidance should match the scalar path (ships backed by the world arrays)
+    from space_bots.headless_engine_adapter import HeadlessEngineAdapter
+    from space_bots.ships.ship import Ship
+    engine = HeadlessEngineAdapter(None)
+    earth = [Ship(engine, uniform(400, 600), uniform(400, 600), ship_type='fighter') for _ in range(20)]
+    zerg = [Ship(engine, uniform(400, 600), uniform(400, 600), ship_type='zergling') for _ in range(20)]
+    pairs = [(s, z) for s in earth for z in zerg]
+
+    def avoid(avoidance_path):
+        for s in earth:
+            s.force_x = s.force_y = 0.0
+        avoidance_path([s for s, _ in pairs], [z for _, z in pairs], [2.0] * len(pairs))
+        return forces(earth)
+
+    scalar = avoid(_avoidance_python)
+    batched = avoid(avoidance_forces)
+    assert any(fx for fx, _ in scalar)
+    for (sx, sy), (bx, by) in zip(scalar, batched):
+        assert math.isclose(sx, bx, rel_tol=1e-9, abs_tol=1e-12)
+        assert math.isclose(sy, by, rel_tol=1e-9, abs_tol=1e-12)
+    print(f'NumPy Kernels: {have_numpy()}')
+
+
+if __name__ == "__main__":
+    test()
@@ -1,6 +1,8 @@
 """ForceUtils: A set of Operations to compute forces on space_bot Entities"""
 import math
-from random import gauss
+
+# Squared distance early rejects leave a little slack so the sqrt based tests below make the final call
+_REJECT_MARGIN = 1.000001
 
 
 def distance_between(source, target):
@@ -27,6 +29,22 @@ def normalized_distance_vectors(source, target):
     return n_st, n_ts
 
 
+def segment_closest_approach(x0, y0, x1, y1, px, py):
+    """Closest approach of the segment (x0, y0) -> (x1, y1) to the point (px, py)
+       Returns:
+           (t, distance): t is how far along the segment (0 to 1) and distance is the closest distance
+    """
+    seg_dx = x1 - x0
+    seg_dy = y1 - y0
+    length_sq = seg_dx * seg_dx + seg_dy * seg_dy
+    t = 0.0
+    if length_sq:
+        t = max(0.0, min(1.0, ((px - x0) * seg_dx + (py - y0) * seg_dy) / length_sq))
+    dx = px - (x0 + t * seg_dx)
+    dy = py - (y0 + t * seg_dy)
+    return t, math.sqrt(dx * dx + dy * dy)
+
+
 def hitting(source, target):
     """Simply test to see if source and target are hitting/overlapping"""
     min_dist = source.collision_radius + target.collision_radius
@@ -92,6 +110,80 @@ def attraction_forces(source, target, within_range):
     return source_attraction, target_attraction
 
 
+def add_repulsion(force_x, force_y, s_index, t_index, sx, sy, s_mass, tx, ty, t_mass, rest_distance,
+                  s_scale=1.0, t_scale=1.0):
+    """Fast path repulsion_forces(): raw coordinates in, scaled forces added into the force buffers
+       Note: Same results as repulsion_forces() but no tuples and far away pairs are rejected before the sqrt
+       Args:
+           force_x, force_y: The force accumulators (e.g. the WorldArrays force_x/force_y)
+           s_index, t_index: Where the source/target forces get added (None to skip that side)
+           sx, sy, s_mass: Source position and mass
+           tx, ty, t_mass: Target position and mass
+           rest_distance: No force beyond this distance
+           s_scale, t_scale: Scale factors for the source/target forces
+       Returns:
+           bool: True if the pair was close enough for a force
+    """
+    dx = tx - sx
+    dy = ty - sy
+    dist_sq = dx * dx + dy * dy
+    if dist_sq == 0 or dist_sq > rest_distance * rest_distance * _REJECT_MARGIN:
+        return False
+    cur_distance = math.sqrt(dist_sq)
+    if cur_distance > rest_distance:
+        return False
+
+    # Repulsion (see repulsion_forces() above)
+    repulsion_factor = 1000.0/(cur_distance*cur_distance)
+    repulsion_x = -(dx/cur_distance) * repulsion_factor
+    repulsion_y = -(dy/cur_distance) * repulsion_factor
+    if t_index is not None:
+        force_x[t_index] -= repulsion_x * t_scale
+        force_y[t_index] -= repulsion_y * t_scale
+    if s_index is not None:
+        t_s_ratio = t_mass/s_mass
+        s_t_ratio = s_mass/t_mass
+        force_x[s_index] += repulsion_x * t_s_ratio * s_t_ratio * s_scale
+        force_y[s_index] += repulsion_y * t_s_ratio * s_t_ratio * s_scale
+    return True
+
+
+def add_attraction(force_x, force_y, s_index, t_index, sx, sy, tx, ty, within_range, s_scale=1.0, t_scale=1.0):
+    """Fast path attraction_forces(): raw coordinates in, scaled forces added into the force buffers
+       Note: Same results as attraction_forces() but no tuples and close pairs are rejected before the sqrt
+       Args:
+           force_x, force_y: The force accumulators (e.g. the WorldArrays force_x/force_y)
+           s_index, t_index: Where the source/target forces get added (None to skip that side)
+           sx, sy: Source position
+           tx, ty: Target position
+           within_range: No force within this distance
+           s_scale, t_scale: Scale factors for the source/target forces
+       Returns:
+           bool: True if the pair was far enough apart for a force
+    """
+    dx = tx - sx
+    dy = ty - sy
+    dist_sq = dx * dx + dy * dy
+    if dist_sq * _REJECT_MARGIN < within_range * within_range:
+        return False
+    cur_distance = math.sqrt(dist_sq)
+    if cur_distance < within_range:
+        return False
+
+    # Attraction (see attraction_forces() above)
+    away_distance = min(cur_distance-within_range, 500)
+    attraction_factor = max(away_distance*0.01, 1)
+    attraction_x = dx/cur_distance * attraction_factor
+    attraction_y = dy/cur_distance * attraction_factor
+    if s_index is not None:
+        force_x[s_index] += attraction_x * s_scale
+        force_y[s_index] += attraction_y * s_scale
+    if t_index is not None:
+        force_x[t_index] -= attraction_x * t_scale
+        force_y[t_index] -= attraction_y * t_scale
+    return True
+
+
 def attack_forces(source, target):
     """Forces used to attack a target"""
 
@@ -116,20 +208,6 @@ def force_based_movement(entity, limit=None):
     entity.y += delta_y
 
 
-def resolve_coincident(entity_list):
-    """Make sure that all entities do not coincide"""
-
-    for e1 in entity_list:
-        for e2 in entity_list:
-            cur_distance = distance_between(e1, e2)
-
-            # Are we coincident?
-            if cur_distance < 0.001:
-                # Force a position change (just e1 is fine)
-                e1.x += gauss(0, 50)
-                e1.y += gauss(0, 50)
-
-
 # Simple test of the ForceUtils functionality
 def test():
     """Test for ForceUtils Functionality"""
@@ -212,6 +290,27 @@ def test():
     b = FakeEntity(500, 500, 3, 10)
     print(attraction_forces(a, b, 10))
 
+    # Swept test: the segment passes right through a point that both end points miss
+    print('<< Segment Closest Approach >>')
+    assert segment_closest_approach(0, 0, 100, 0, 50, 1) == (0.5, 1.0)
+    assert segment_closest_approach(0, 0, 100, 0, -3, 4) == (0.0, 5.0)
+    assert segment_closest_approach(0, 0, 100, 0, 103, 4) == (1.0, 5.0)
+    assert segment_closest_approach(7, 7, 7, 7, 10, 11) == (0.0, 5.0)
+
+    # Fast path (buffers) should give exactly the same forces as the tuple versions
+    print('<< Fast Path Forces >>')
+    a = FakeEntity(5, 5, 3, 2)
+    for b in [FakeEntity(5, 5, 3, 7), FakeEntity(6.5, 5.25, 3, 7), FakeEntity(9, 9, 3, 7), FakeEntity(50, 50, 3, 7)]:
+        force_x, force_y = [0.0, 0.0], [0.0, 0.0]
+        add_repulsion(force_x, force_y, 0, 1, a.x, a.y, a.mass, b.x, b.y, b.mass, 6, 3.0, 0.5)
+        (dx, dy), (co_dx, co_dy) = repulsion_forces(a, b, 6)
+        assert force_x == [dx * 3.0, co_dx * 0.5] and force_y == [dy * 3.0, co_dy * 0.5]
+
+        force_x, force_y = [0.0, 0.0], [0.0, 0.0]
+        add_attraction(force_x, force_y, 0, 1, a.x, a.y, b.x, b.y, 1, 3.0, 0.5)
+        (dx, dy), (co_dx, co_dy) = attraction_forces(a, b, 1)
+        assert force_x == [dx * 3.0, co_dx * 0.5] and force_y == [dy * 3.0, co_dy * 0.5]
+
 
 if __name__ == "__main__":
     test()
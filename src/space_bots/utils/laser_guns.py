@@ -22,6 +22,7 @@ class LaserGuns(weapon.Weapon):
         self.mount = CenterMount(ship) if mount_points == 1 else GimbalMount(ship, mount_points)
         self.cap_cost *= mount_points
         self.min_capacitor = self.cap_cost
+        self.beams = []  # Laser beams fired this tick (mount points, target position)
 
     def communicate(self, comms):
         """Weapons can post sounds and even announcements"""
@@ -30,14 +31,18 @@ class LaserGuns(weapon.Weapon):
     def update(self, target):
         """Weapons update themselves, for instance Torp Launchers need to update Torps"""
         self.mount.update(target)
+        self.beams = []
 
     def draw(self, target):
-        """Draw the Laser Mounts"""
+        """Draw the Laser Mounts and any lasers fired this tick"""
         self.mount.draw()
+        for mount_points, target_pos in self.beams:
+            for mount_point in mount_points:
+                self.game_engine.draw_line(self.color, (mount_point[0], mount_point[1]), target_pos, width=self.width)
 
     def fire(self, target):
         """Fire the Weapon at the given target
-           Note: Some Weapons (e.g. Lasers) will draw themselves when they are fired
+           Note: The lasers fired get drawn later (in draw)
         """
         # Do we have enough capacitor?
         if self.my_ship.s.capacitor < self.min_capacitor:
@@ -58,9 +63,8 @@ class LaserGuns(weapon.Weapon):
         # Get our current laser damage from my ship (might be buffed)
         laser_damage = self.my_ship.p.laser_damage * self.mount.num_mount_points() * self.my_ship.p.outgoing_damage_modifier
 
-        # Fire (and Draw) the lasers
-        for mount_point in self.mount.get_mount_locations():
-            self.game_engine.draw_line(self.color, (mount_point[0], mount_point[1]), (target.x, target.y), width=self.width)
+        # Keep track of the lasers fired (so we can draw them)
+        self.beams.append((self.mount.get_mount_locations(), (target.x, target.y)))
 
         # Fire the laser(s) and do damage to target ship
         target.damage(laser_damage)
@@ -0,0 +1,52 @@
+"""LazyImport: Module proxies that don't import the (heavy) module until it's actually used"""
+import sys
+import importlib
+import importlib.util
+
+
+class LazyModule:
+    """LazyModule: Stands in for a module and imports it on first attribute access
+       Usage:
+            np = lazy_import('numpy')  # None if numpy isn't installed (nothing is imported yet)
+            np.zeros(10)               # numpy gets imported here
+       Note: Attributes are copied onto the proxy as they're used, so after the first access it's a plain lookup
+    """
+    def __init__(self, name):
+        self.__dict__['_name'] = name
+
+    def __getattr__(self, attr):
+        value = getattr(importlib.import_module(self._name), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def is_loaded(self):
+        """Has the module actually been imported yet?"""
+        return self._name in sys.modules
+
+    def __repr__(self):
+        return f'<LazyModule {self._name}>'
+
+
+def lazy_import(name):
+    """LazyModule for the named module (None if the module isn't installed, same as a failed optional import)"""
+    return LazyModule(name) if importlib.util.find_spec(name) is not None else None
+
+
+# Simple test of the LazyImport functionality
+def test():
+    """Test for LazyImport Functionality"""
+
+    # Missing modules come back as None (just like the try/except ImportError pattern)
+    assert lazy_import('not_a_real_module_xyz') is None
+
+    # The module is only imported on first use
+    sys.modules.pop('colorsys', None)
+    colorsys = lazy_import('colorsys')
+    assert 'colorsys' not in sys.modules
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert 'colorsys' in sys.modules and colorsys.is_loaded()
+    assert 'rgb_to_hsv' in vars(colorsys)
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,151 @@
+"""Placement: Grid based placement of space_bot Entities (spawning, coincident resolution, spacing out)"""
+import math
+from random import gauss, uniform
+
+# Local Imports
+from space_bots.utils.spatial_hash import SpatialHash
+
+
+def resolve_coincident(entity_list, tolerance=0.001):
+    """Make sure that all entities do not coincide (bumps an entity that lands on top of an earlier one)
+       Note: Each entity is only checked against the entities in its own/neighboring cells
+    """
+    placed = {}
+    inv_size = 1.0 / tolerance
+    for e in entity_list:
+        while _coincides(placed, e, inv_size, tolerance):
+            # Force a position change
+            e.x += gauss(0, 50)
+            e.y += gauss(0, 50)
+        placed.setdefault((math.floor(e.x * inv_size), math.floor(e.y * inv_size)), []).append(e)
+
+
+def _coincides(placed, e, inv_size, tolerance):
+    """Internal: Is the entity within tolerance of anything already placed (looks at the 3x3 cell neighborhood)"""
+    cx, cy = math.floor(e.x * inv_size), math.floor(e.y * inv_size)
+    for ox in (-1, 0, 1):
+        for oy in (-1, 0, 1):
+            for other in placed.get((cx + ox, cy + oy), ()):
+                if math.sqrt((other.x - e.x) ** 2 + (other.y - e.y) ** 2) < tolerance:
+                    return True
+    return False
+
+
+def spawn_positions(num_positions, x, y, spacing, jitter=0.25):
+    """Jittered grid of positions centered on (x, y)
+       Args:
+           num_positions: How many positions we want
+           x, y: The spawn point
+           spacing: Distance between grid points (use the pad diameter so nothing overlaps)
+           jitter: Random offset for each point (as a fraction of the spacing)
+       Returns:
+           list: [(x, y), ...] the positions (closest to the spawn point first)
+    """
+    side = math.ceil(math.sqrt(num_positions))
+    half = (side - 1) / 2.0
+    grid = sorted(((col - half) ** 2 + (row - half) ** 2, row, col) for row in range(side) for col in range(side))
+    offset = jitter * spacing
+    return [(x + (col - half) * spacing + uniform(-offset, offset), y + (row - half) * spacing + uniform(-offset, offset))
+            for _, row, col in grid[:num_positions]]
+
+
+def spawn_around(entities, x, y, spacing=None):
+    """Put the entities on a jittered grid around the spawn point (x, y)
+       Note: Default spacing is the largest pad diameter of the entities
+    """
+    if spacing is None:
+        spacing = 2 * SpatialHash.max_pad_radius(entities)
+    for e, (new_x, new_y) in zip(entities, spawn_positions(len(entities), x, y, spacing)):
+        e.x = new_x
+        e.y = new_y
+
+
+def space_out(entities, min_distance, bounds, iterations=50, step=10):
+    """Push apart entities that are closer than min_distance (pair candidates come from a SpatialHash)
+       Args:
+           entities: List of entities (anything with x and y)
+           min_distance: Entities closer than this get pushed apart
+           bounds: (left, top, right, bottom) entities are kept inside these
+           iterations: Max number of passes (stops early when nothing is too close)
+           step: How far each entity in a close pair moves per pass
+    """
+    left, top, right, bottom = bounds
+    grid = SpatialHash(min_distance)
+    for _ in range(iterations):
+        grid.rebuild(entities)
+        moved = False
+        for i, j in grid.candidate_pairs():
+            e1, e2 = entities[i], entities[j]
+            dx = e2.x - e1.x
+            dy = e2.y - e1.y
+            mag = math.sqrt(dx * dx + dy * dy)
+            if mag == 0 or mag >= min_distance:
+                continue
+            dx, dy = dx / mag * step, dy / mag * step
+            e1.x -= dx
+            e1.y -= dy
+            e2.x += dx
+            e2.y += dy
+            moved = True
+
+        # Boundaries
+        for e in entities:
+            e.x = max(min(e.x, right), left)
+            e.y = max(min(e.y, bottom), top)
+        if not moved:
+            break
+
+
+# Simple test of the Placement functionality
+def test():
+    """Test for Placement Functionality"""
+    import random
+    from space_bots.universe import Universe
+    from space_bots.headless_engine_adapter import HeadlessEngineAdapter
+
+    class FakeEntity:
+        def __init__(self, x, y, pad_radius=10):
+            self.x = x
+            self.y = y
+            self.pad_radius = pad_radius
+
+    def min_distance(entities):
+        return min(math.sqrt((a.x - b.x) ** 2 + (a.y - b.y) ** 2)
+                   for n, a in enumerate(entities) for b in entities[n+1:])
+
+    random.seed(7)
+
+    # Coincident entities get bumped (entities that aren't coincident stay put)
+    entities = [FakeEntity(100, 100) for _ in range(20)] + [FakeEntity(500, 500)]
+    resolve_coincident(entities)
+    assert min_distance(entities) >= 0.001
+    assert (entities[0].x, entities[0].y) == (100, 100)
+    assert (entities[-1].x, entities[-1].y) == (500, 500)
+
+    # Spawn positions: jittered grid around the spawn point, no overlaps
+    positions = spawn_positions(500, 1100, 700, spacing=20)
+    assert len(positions) == 500 and len(set(positions)) == 500
+    entities = [FakeEntity(1100, 700) for _ in range(500)]
+    spawn_around(entities, 1100, 700)
+    assert min_distance(entities) >= 20 * (1 - 2 * 0.25)
+    centroid_x = sum(e.x for e in entities) / len(entities)
+    centroid_y = sum(e.y for e in entities) / len(entities)
+    assert abs(centroid_x - 1100) < 20 and abs(centroid_y - 700) < 20
+
+    # Space out: everything ends up at least min_distance apart (and inside the bounds)
+    entities = [FakeEntity(random.randint(300, 1200), random.randint(200, 700)) for _ in range(12)]
+    space_out(entities, 300, (50, 50, 1550, 850), iterations=500)
+    assert min_distance(entities) >= 300
+    assert all(50 <= e.x <= 1550 and 50 <= e.y <= 850 for e in entities)
+
+    # A whole zerg pack is spawned together (the squads in the pack don't land on each other)
+    universe = Universe(announcements=False)
+    universe.set_game_engine(HeadlessEngineAdapter(universe))
+    universe.mission_planner.standard_zerg_pack(pack_size=3.0)
+    pack = universe.all_ships
+    assert len(universe.squads) > 1
+    assert min_distance(pack) >= max(s.pad_radius for s in pack)
+
+
+if __name__ == "__main__":
+    test()
@@ -0,0 +1,60 @@
+"""SimClock: A deterministic fixed-timestep clock for the Space Bots simulation"""
+
+
+class SimClock:
+    """SimClock: A deterministic fixed-timestep clock for the Space Bots simulation
+       Usage:
+            clock = SimClock(dt=1.0/120)
+            clock.tick()   # Advance one fixed timestep (the Universe does this every update)
+            clock.time()   # Current simulation time in seconds (drop-in for time.time())
+       Note: Anything that takes a clock also accepts the 'time' module itself (wall-clock time)
+    """
+    def __init__(self, dt=1.0/120):
+        """SimClock Initialization"""
+        self.dt = dt
+        self.ticks = 0
+
+    def tick(self):
+        """Advance the clock by one fixed timestep"""
+        self.ticks += 1
+
+    def time(self):
+        """Current simulation time in seconds"""
+        # Note: ticks * dt (instead of accumulating dt) so there's no floating point drift
+        return self.ticks * self.dt
+
+    def reset(self):
+        """Reset the clock back to zero"""
+        self.ticks = 0
+
+
+def test():
+    """Test for the SimClock class"""
+    from space_bots.utils.sound_limiter import SoundLimiter
+
+    # Create the SimClock
+    clock = SimClock(dt=0.5)
+    assert clock.time() == 0
+    clock.tick()
+    clock.tick()
+    assert clock.time() == 1.0
+
+    # 120 ticks is exactly one second (no matter how fast we run)
+    clock = SimClock()
+    for _ in range(120):
+        clock.tick()
+    assert clock.time() == 1.0
+
+    # The SoundLimiter can run on simulation time
+    limiter = SoundLimiter(clock)
+    limiter.add_limit('laser', 1)
+    assert limiter.is_limited('laser') is True
+    for _ in range(121):
+        clock.tick()
+    assert limiter.is_limited('laser') is False
+
+
+if __name__ == '__main__':
+
+    # Run the test
+    test()
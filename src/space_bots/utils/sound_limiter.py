@@ -5,13 +5,17 @@ import time
 class SoundLimiter:
     """Sound Limiter uses a simple dictionary check to see if a sound has been played recently
        Usage:
-            limiter = SoundLimiter()
+            limiter = SoundLimiter()  # Or SoundLimiter(clock) to limit on simulation time
             limiter.add(<sound_name>, <seconds>)
             limiter.is_limited(<sound_name>)
             limiter.clear()
     """
-    def __init__(self):
-        """SoundLimiter Initialization"""
+    def __init__(self, clock=None):
+        """SoundLimiter Initialization
+           Args:
+               clock: Anything with a time() method (e.g. SimClock), defaults to wall-clock time
+        """
+        self.clock = clock or time
         self._store = dict()
 
     def add_limit(self, sound_name, seconds):
@@ -20,7 +24,7 @@ class SoundLimiter:
                sound_name: The name of the sound
                seconds: How many seconds the sound should be limited for (can be fractional)
         """
-        expire = time.time() + seconds
+        expire = self.clock.time() + seconds
         self._store[sound_name] = (expire, seconds)
 
     def is_limited(self, sound_name):
@@ -39,7 +43,7 @@ class SoundLimiter:
             return False
 
         # Now we test if the sound
-        now = time.time()
+        now = self.clock.time()
         expire, seconds = self._store[sound_name]
         if now < expire:
             return True
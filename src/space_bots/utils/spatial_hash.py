@@ -0,0 +1,207 @@
+"""SpatialHash: A Uniform Grid used to find nearby space_bot Entities without testing every pair"""
+import math
+from collections import defaultdict
+
+
+class SpatialHash:
+    """SpatialHash: A Uniform Grid used to find nearby space_bot Entities without testing every pair
+       Usage:
+            grid = SpatialHash()
+            grid.rebuild(entities, cell_size)  # Bucket the entities into grid cells (once per tick)
+            grid.query(x, y, radius)           # Indices of entities that might be within radius of (x, y)
+            grid.within(x, y, radius)          # Indices of entities that ARE within radius of (x, y)
+            grid.nearest(x, y, k)              # Indices of the k nearest entities to (x, y)
+            grid.candidate_pairs()             # Index pairs (i < j) of entities in the same/neighboring cells
+       Note: candidate_pairs() only finds every interacting pair when cell_size >= the max interaction distance
+    """
+    # Half of the 3x3 neighborhood (the other half is covered from the neighbor's side)
+    _forward_neighbors = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    def __init__(self, cell_size=100.0):
+        """SpatialHash Initialization"""
+        self.cell_size = cell_size
+        self.entities = []
+        self.cells = defaultdict(list)
+        self.cell_bounds = None  # (min_cx, min_cy, max_cx, max_cy) of the occupied cells
+
+    @staticmethod
+    def max_pad_radius(*entity_lists, default=1.0):
+        """The largest pad_radius over all the given entity lists"""
+        return max((e.pad_radius for entities in entity_lists for e in entities), default=default)
+
+    def cell(self, x, y):
+        """The grid cell that contains the point (x, y)"""
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def rebuild(self, entities, cell_size=None):
+        """Bucket all the entities into their grid cells
+           Args:
+               entities: List of entities (anything with x and y)
+               cell_size: Optionally change the cell size for this build
+        """
+        if cell_size:
+            self.cell_size = cell_size
+        self.entities = entities
+        self.cells = defaultdict(list)
+        inv_size = 1.0 / self.cell_size
+        for index, e in enumerate(entities):
+            self.cells[(math.floor(e.x * inv_size), math.floor(e.y * inv_size))].append(index)
+        if self.cells:
+            cell_xs = [cx for cx, _ in self.cells]
+            cell_ys = [cy for _, cy in self.cells]
+            self.cell_bounds = (min(cell_xs), min(cell_ys), max(cell_xs), max(cell_ys))
+        else:
+            self.cell_bounds = None
+
+    def query(self, x, y, radius):
+        """Indices (sorted) of the entities in the cells that overlap the circle at (x, y) with the given radius
+           Note: These are candidates, the caller still needs to do the actual distance test
+        """
+        min_cx, min_cy = self.cell(x - radius, y - radius)
+        max_cx, max_cy = self.cell(x + radius, y + radius)
+        if min_cx == max_cx and min_cy == max_cy:
+            return self.cells.get((min_cx, min_cy), [])
+        indices = []
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    indices += bucket
+        indices.sort()
+        return indices
+
+    def query_entities(self, x, y, radius):
+        """Same as query() but returns the entities instead of the indices"""
+        return [self.entities[i] for i in self.query(x, y, radius)]
+
+    def within(self, x, y, radius):
+        """Indices (sorted) of the entities that are within (strictly less than) radius of (x, y)"""
+        entities = self.entities
+        return [i for i in self.query(x, y, radius)
+                if math.sqrt((entities[i].x - x) ** 2 + (entities[i].y - y) ** 2) < radius]
+
+    def nearest(self, x, y, k=1, accept=None):
+        """Indices of the k nearest entities to (x, y), nearest first (ties go to the lower index)
+           Args:
+               x, y: The query point
+               k: How many entities to return
+               accept: Optional function, only entities where accept(entity) is True are considered
+        """
+        if self.cell_bounds is None or k <= 0:
+            return []
+        min_cx, min_cy, max_cx, max_cy = self.cell_bounds
+        cx, cy = self.cell(x, y)
+        max_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy)
+
+        # Search outward ring by ring, everything beyond ring r is at least r*cell_size away
+        found = []
+        entities = self.entities
+        ring = 0
+        while ring <= max_ring:
+            for ring_cell in self._ring_cells(cx, cy, ring):
+                for i in self.cells.get(ring_cell, ()):
+                    e = entities[i]
+                    if accept is None or accept(e):
+                        found.append((math.sqrt((e.x - x) ** 2 + (e.y - y) ** 2), i))
+            if len(found) >= k:
+                found.sort()
+                found = found[:k]
+                if found[-1][0] <= ring * self.cell_size:
+                    break
+            ring += 1
+        found.sort()
+        return [i for _, i in found[:k]]
+
+    @staticmethod
+    def _ring_cells(cx, cy, ring):
+        """Internal: The cells on the square ring around (cx, cy)"""
+        if ring == 0:
+            return [(cx, cy)]
+        cells = [(cx + dx, cy - ring) for dx in range(-ring, ring + 1)]
+        cells += [(cx + dx, cy + ring) for dx in range(-ring, ring + 1)]
+        cells += [(cx - ring, cy + dy) for dy in range(-ring + 1, ring)]
+        cells += [(cx + ring, cy + dy) for dy in range(-ring + 1, ring)]
+        return cells
+
+    def candidate_pairs(self):
+        """All the index pairs (i < j) of entities in the same or neighboring cells
+           Note: Pairs are sorted so callers visit them in the same order as a brute force double loop
+        """
+        pairs = []
+        cells = self.cells
+        for (cx, cy), bucket in cells.items():
+            # Pairs within this cell (buckets are built in index order)
+            for n, i in enumerate(bucket):
+                for j in bucket[n+1:]:
+                    pairs.append((i, j))
+
+            # Pairs with the forward neighbors
+            for ox, oy in self._forward_neighbors:
+                neighbor = cells.get((cx + ox, cy + oy))
+                if neighbor:
+                    for i in bucket:
+                        for j in neighbor:
+                            pairs.append((i, j) if i < j else (j, i))
+        pairs.sort()
+        return pairs
+
+
+# Simple test of the SpatialHash functionality
+def test():
+    """Test for SpatialHash Class"""
+    from random import uniform, seed
+    from space_bots.utils import force_utils
+
+    class FakeEntity:
+        def __init__(self, x, y, pad_radius):
+            self.x = x
+            self.y = y
+            self.pad_radius = pad_radius
+
+    # Lots of entities, some of them clumped together
+    seed(42)
+    entities = [FakeEntity(uniform(0, 1600), uniform(0, 1000), uniform(5, 30)) for _ in range(300)]
+    entities += [FakeEntity(uniform(1100, 1110), uniform(700, 710), 5) for _ in range(50)]
+
+    # Cell size is set by the max interaction distance (sum of the two largest pad radii)
+    grid = SpatialHash()
+    grid.rebuild(entities, cell_size=2 * SpatialHash.max_pad_radius(entities))
+
+    # Brute force pairs that are within interaction distance
+    brute_pairs = []
+    for i, e1 in enumerate(entities):
+        for j in range(i+1, len(entities)):
+            e2 = entities[j]
+            if force_utils.distance_between(e1, e2) <= e1.pad_radius + e2.pad_radius:
+                brute_pairs.append((i, j))
+
+    # The grid candidates should cover ALL of the brute force pairs (in the same order)
+    pairs = grid.candidate_pairs()
+    assert len(pairs) == len(set(pairs))
+    assert pairs == sorted(pairs)
+    close_pairs = [(i, j) for i, j in pairs
+                   if force_utils.distance_between(entities[i], entities[j]) <= entities[i].pad_radius + entities[j].pad_radius]
+    assert close_pairs == brute_pairs
+    print(f'Candidate Pairs: {len(pairs)}  Brute Force Pairs: {len(entities)*(len(entities)-1)//2}')
+
+    # Range query should find everything within the radius
+    for radius in [5, 60, 250]:
+        x, y = 1105, 705
+        found = [i for i in grid.query(x, y, radius) if math.hypot(entities[i].x-x, entities[i].y-y) < radius]
+        brute = [i for i, e in enumerate(entities) if math.hypot(e.x-x, e.y-y) < radius]
+        assert found == brute
+        assert grid.within(x, y, radius) == [i for i in range(len(entities))
+                                             if force_utils.distance_between(FakeEntity(x, y, 0), entities[i]) < radius]
+
+    # Nearest neighbors should match a brute force sort (from inside and outside the occupied cells)
+    for x, y in [(1105, 705), (10, 10), (800, 500), (-500, 2000)]:
+        brute = sorted(range(len(entities)), key=lambda i: force_utils.distance_between(FakeEntity(x, y, 0), entities[i]))
+        for k in [1, 4, 20]:
+            assert grid.nearest(x, y, k) == brute[:k]
+        even = [i for i in brute if i % 2 == 0]
+        assert grid.nearest(x, y, 3, accept=lambda e: entities.index(e) % 2 == 0) == even[:3]
+
+
+if __name__ == "__main__":
+    test()
@@ -7,23 +7,35 @@ from space_bots.utils import force_utils
 
 class Torp(entity.Entity):
     """Torp: Class for the Torpedoes in Space Bots"""
+    __slots__ = ('origin_ship', 'target', 'level', 'damage', 'color', 'released', 'release_counter', 'expire', 'radius')
+
     def __init__(self, origin_ship, level=1):
 
+        # Call SuperClass (Entity) Initialization
+        super().__init__(origin_ship.game_engine, origin_ship.x, origin_ship.y, mass=10, speed=None)
+
         # Set my Torp Parameters
+        self.reset(origin_ship, level)
+
+    def reset(self, origin_ship, level=1):
+        """Set (or reset) the Torp Parameters, the TorpPool resets torps instead of creating new ones"""
         self.origin_ship = origin_ship
         self.target = None
         self.level = level
         self.damage = level * 10
-        self.mass = 10
-        self.speed = None
         self.color = origin_ship.p.color
         self.released = False
         self.release_counter = 0
         self.expire = 300
         self.radius = 5
+        self.delete_me = False
 
-        # Call SuperClass (Entity) Initialization
-        super().__init__(origin_ship.game_engine, origin_ship.x, origin_ship.y, mass=self.mass, speed=self.speed)
+        # Staged on the origin ship
+        self.game_engine = origin_ship.game_engine
+        self.x = origin_ship.x
+        self.y = origin_ship.y
+        self.force_x = 0
+        self.force_y = 0
 
         # Torps don't slow down
         self.force_damp = 1.0
@@ -46,7 +58,7 @@ class Torp(entity.Entity):
         pass  # Torps don't say much
 
     def update(self):
-        """Update the Torp"""
+        """Update the Torp (single torp version, the TorpPool steps all the pooled torps at once)"""
 
         # Check for Torp Expiration
         if self.released:
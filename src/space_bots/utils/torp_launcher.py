@@ -1,9 +1,8 @@
 """TorpLauncher: A Torpedo Launcher for Space Bots"""
-import time
 import math
 
 # Local Imports
-from space_bots.utils import weapon, force_utils, torp
+from space_bots.utils import weapon, force_utils
 
 
 class TorpLauncher(weapon.Weapon):
@@ -14,6 +13,7 @@ class TorpLauncher(weapon.Weapon):
         super().__init__(ship)
 
         # TorpLauncher specific stuff
+        self.pool = None  # The Universe hands us its shared TorpPool (see set_pool)
         self.torps = []
         self.torp_range = 350
         self.next_torp_reload = 0
@@ -25,6 +25,11 @@ class TorpLauncher(weapon.Weapon):
         self.torp_reload_rate = 1.0/mount_points
         self.min_capacitor = min_capacitor if min_capacitor else self.torp_cap_cost * mount_points * 2
 
+    def set_pool(self, pool):
+        """Use this TorpPool (the Universe shares one pool across all the launchers)"""
+        self.recycle_torps(all_torps=True)
+        self.pool = pool
+
     def communicate(self, comms):
         """Weapons can post sounds and even announcements"""
         pass
@@ -32,23 +37,14 @@ class TorpLauncher(weapon.Weapon):
     def update(self, target):
         """We need to manage both staged and launched Torps"""
         # Delete expired or exploded torps
-        self.current_time = time.time()
-        self.expire_torps()
-        self.torps = [t for t in self.torps if not t.delete_me]
+        self.current_time = self.my_ship.clock.time()
+        self.recycle_torps()
 
         # Load Torps into our launch points
         if self.torp_available_for_loading():
             self.load_next_available_launch_point()
 
-        # Update launch points relative to ship movements
-        for lp in self.launch_points:
-            if lp['torp']:
-                lp['torp'].x = lp['x'] + self.my_ship.x
-                lp['torp'].y = lp['y'] + self.my_ship.y
-
-        # Update All of my Torps (both staged and launched)
-        for t in self.torps:
-            t.update()
+        # Note: The Universe steps ALL the torps (staged and launched) in one go, see TorpPool.update()
 
     def draw(self, target):
         """Draw All of my Torps (both staged and launched)"""
@@ -68,10 +64,9 @@ class TorpLauncher(weapon.Weapon):
         # Fire Torps (by setting the active target)
         if self.fully_loaded():
             for lp in self.launch_points[:launch]:
-                lp['torp'].set_target(target)
                 lp['torp'].force_x = lp['x'] * .1
                 lp['torp'].force_y = lp['y'] * .1
-                lp['torp'].released = True
+                self.pool.launch(lp['torp'], target)
                 lp['torp'] = None  # Torp released, so remove it from launch point
 
     def _generate_launch_points(self, n):
@@ -89,7 +84,7 @@ class TorpLauncher(weapon.Weapon):
         # Select the next launch point
         for lp in self.launch_points:
             if lp['torp'] is None:
-                new_torp = torp.Torp(self.my_ship, self.torp_level)
+                new_torp = self.pool.acquire(self.my_ship, self.torp_level, lp['x'], lp['y'])
                 lp['torp'] = new_torp
                 self.torps.append(new_torp)  # We have to track torps even after they get released
                 self.my_ship.s.capacitor -= self.torp_cap_cost
@@ -98,20 +93,25 @@ class TorpLauncher(weapon.Weapon):
         # Shouldn't get here
         print('No Launch Points!!!!')
 
-    def live_torps(self):
-        """Return a list of Torps that have been launched"""
-        return [t for t in self.torps if t.released]
+    def recycle_torps(self, all_torps=False):
+        """Give the expired/exploded torps (or all of them) back to the pool, in place (no list rebuild)"""
+        for index in range(len(self.torps) - 1, -1, -1):
+            t = self.torps[index]
+            if all_torps or t.delete_me:
+                del self.torps[index]
+                self.pool.recycle(t)
+        if all_torps:
+            for lp in self.launch_points:
+                lp['torp'] = None
+
+    def pre_delete(self):
+        """The ship is going away, so give all of my torps back to the pool"""
+        self.recycle_torps(all_torps=True)
 
     def fully_loaded(self):
         """Is the Launcher fully Loaded?"""
         return all([lp['torp'] for lp in self.launch_points])
 
-    def expire_torps(self):
-        """Time Expiration for Existing Torps"""
-        for t in self.torps:
-            if t.release_counter > t.expire:
-                t.delete_me = True
-
     def torp_available_for_loading(self):
         """Is a new Torp available for firing?"""
         return (self.my_ship.s.capacitor > self.min_capacitor) and \
@@ -0,0 +1,264 @@
+"""TorpPool: Reusable Torp slots with free-list recycling (one pool for the whole Universe)"""
+import math
+from array import array
+
+# Local Imports
+from space_bots.utils.lazy_import import lazy_import
+from space_bots.utils.torp import Torp
+
+# NumPy is optional (imported on first use), if it's not installed we step one torp at a time
+np = lazy_import('numpy')
+
+
+class TorpPool:
+    """TorpPool: Reusable Torp slots with free-list recycling (one pool for the whole Universe)
+       Usage:
+            pool = TorpPool()
+            new_torp = pool.acquire(ship, level, offset_x, offset_y)  # Staged on the ship (recycled if possible)
+            pool.launch(new_torp, target)  # Torp released, it's now in the live view
+            pool.update(world)             # Guidance/expiry for ALL the torps in one vectorized step (once per tick)
+            pool.live_torps()              # Live (launched) torps, a view that never gets rebuilt
+            pool.recycle(new_torp)         # Expired/exploded, back on the free-list
+       Note: While a torp is in the pool the pool arrays own its counter/target (positions/forces are in the world)
+    """
+    fields = ('world_index', 'owner_index', 'offset_x', 'offset_y', 'released', 'target_index', 'counter', 'expire',
+              'prev_x', 'prev_y')
+
+    # Torps start homing in on their target after this many ticks
+    guidance_delay = 60
+
+    def __init__(self):
+        """TorpPool Initialization"""
+        self.num_allocated = 0
+        self._free = []
+        self._live = {}  # Insertion ordered 'set' of the launched torps (values aren't used)
+
+        # Structure-of-Arrays for the active (staged or launched) torps, slot n is self._active[n]
+        self._active = []
+        self._slots = {}
+        self.world_index = array('q')
+        self.owner_index = array('q')   # World index of the origin ship (staged torps ride along with it)
+        self.offset_x = array('d')      # Launch point offset from the origin ship
+        self.offset_y = array('d')
+        self.released = array('b')
+        self.target_index = array('q')  # World index of the target (-1 for no target)
+        self.counter = array('d')       # Ticks since release
+        self.expire = array('d')
+        self.prev_x = array('d')        # Position before the last integrate step (swept hit detection)
+        self.prev_y = array('d')
+
+    def acquire(self, origin_ship, level=1, offset_x=0.0, offset_y=0.0):
+        """Get a Torp staged on the origin ship from the free-list, only allocate if the free-list is empty"""
+        if self._free:
+            torp = self._free.pop()
+            torp.reset(origin_ship, level)
+        else:
+            self.num_allocated += 1
+            torp = Torp(origin_ship, level)
+
+        # Add the torp to the active arrays
+        self._slots[torp] = len(self._active)
+        self._active.append(torp)
+        for field, value in zip(self.fields, (torp.world_index, origin_ship.world_index, offset_x, offset_y,
+                                              0, -1, 0.0, torp.expire, torp.x, torp.y)):
+            getattr(self, field).append(value)
+        return torp
+
+    def launch(self, torp, target):
+        """Release the Torp at the target, it's now in the live view"""
+        torp.set_target(target)
+        torp.released = True
+        slot = self._slots[torp]
+        self.released[slot] = 1
+        self.target_index[slot] = target.world_index if target is not None else -1
+        self.prev_x[slot] = torp.x
+        self.prev_y[slot] = torp.y
+        self._live[torp] = None
+
+    def recycle(self, torp):
+        """Give the Torp back to the pool (and drop it from the live view)"""
+        self._live.pop(torp, None)
+        slot = self._slots.pop(torp, None)
+        if slot is not None:
+            torp.release_counter = int(self.counter[slot])
+
+            # Swap-remove from the active arrays (the last torp moves into this slot)
+            last = len(self._active) - 1
+            if slot != last:
+                moved = self._active[last]
+                self._active[slot] = moved
+                self._slots[moved] = slot
+                for field in self.fields:
+                    values = getattr(self, field)
+                    values[slot] = values[last]
+            self._active.pop()
+            for field in self.fields:
+                getattr(self, field).pop()
+        torp.delete_me = True
+        self._free.append(torp)
+
+    def live_torps(self):
+        """All the launched Torps (a live view, don't hold on to it across recycles)"""
+        return self._live.keys()
+
+    def live_sweeps(self, world):
+        """The path each launched Torp took over the last integrate step
+           Returns:
+               generator: (torp, prev_x, prev_y, x, y) for each launched torp (expired torps are skipped)
+        """
+        x, y = world.x, world.y
+        for torp in self._live:
+            if torp.delete_me:
+                continue  # Expired this step (not recycled yet), its stale path shouldn't hit anything
+            slot = self._slots[torp]
+            index = self.world_index[slot]
+            yield torp, self.prev_x[slot], self.prev_y[slot], x[index], y[index]
+
+    def num_free(self):
+        """Number of Torps sitting on the free-list"""
+        return len(self._free)
+
+    def release_counter(self, torp):
+        """Ticks since the Torp was released"""
+        return int(self.counter[self._slots[torp]])
+
+    def update(self, world):
+        """Staged torps follow their ship, launched torps count up, expire, home in on the target, and move
+           Note: This replaces Torp.update() for all the torps in the pool (the world integrates the moves)
+        """
+        if not self._active:
+            return
+        if np is None:
+            self._update_python(world)
+            return
+
+        # Pool arrays and world arrays as NumPy views
+        view = world.numpy_views()
+        x, y, force_x, force_y = view['x'], view['y'], view['force_x'], view['force_y']
+        index = np.frombuffer(self.world_index, dtype=np.int64)
+        released = np.frombuffer(self.released, dtype=np.int8).astype(bool)
+        counter = np.frombuffer(self.counter, dtype=np.float64)
+
+        # Staged torps ride along at their launch point
+        staged = ~released
+        if staged.any():
+            owner = np.frombuffer(self.owner_index, dtype=np.int64)[staged]
+            x[index[staged]] = x[owner] + np.frombuffer(self.offset_x, dtype=np.float64)[staged]
+            y[index[staged]] = y[owner] + np.frombuffer(self.offset_y, dtype=np.float64)[staged]
+
+        # Launched torps count up and expire
+        counter[released] += 1
+        expired = released & (counter > np.frombuffer(self.expire, dtype=np.float64))
+        for slot in np.flatnonzero(expired).tolist():
+            self._active[slot].delete_me = True
+
+        # Guidance (see ForceUtils.attack_forces)
+        flying = released & ~expired
+        target = np.frombuffer(self.target_index, dtype=np.int64)
+        guided = flying & (counter > self.guidance_delay) & (target >= 0)
+        if guided.any():
+            gi, ti = index[guided], target[guided]
+            dx = x[ti] - x[gi]
+            dy = y[ti] - y[gi]
+            mag = np.sqrt(dx ** 2 + dy ** 2)
+            on_target = mag != 0
+            gi, dx, dy, mag = gi[on_target], dx[on_target], dy[on_target], mag[on_target]
+            force_x[gi] += dx / mag
+            force_y[gi] += dy / mag
+
+        # Remember where the flying torps were and queue them up for the world integrate step
+        flying_index = index[flying]
+        np.frombuffer(self.prev_x, dtype=np.float64)[flying] = x[flying_index]
+        np.frombuffer(self.prev_y, dtype=np.float64)[flying] = y[flying_index]
+        world.queue_moves(flying_index.tolist())
+
+    def _update_python(self, world):
+        """Internal: Pure-Python version of the torp step"""
+        x, y, force_x, force_y = world.x, world.y, world.force_x, world.force_y
+        moves = []
+        for slot, torp in enumerate(self._active):
+            index = self.world_index[slot]
+            if not self.released[slot]:
+                owner = self.owner_index[slot]
+                x[index] = x[owner] + self.offset_x[slot]
+                y[index] = y[owner] + self.offset_y[slot]
+                continue
+            self.counter[slot] += 1
+            if self.counter[slot] > self.expire[slot]:
+                torp.delete_me = True
+                continue
+            target = self.target_index[slot]
+            if self.counter[slot] > self.guidance_delay and target >= 0:
+                dx = x[target] - x[index]
+                dy = y[target] - y[index]
+                mag = math.sqrt(dx ** 2 + dy ** 2)
+                if mag:
+                    force_x[index] += dx / mag
+                    force_y[index] += dy / mag
+            self.prev_x[slot] = x[index]
+            self.prev_y[slot] = y[index]
+            moves.append(index)
+        world.queue_moves(moves)
+
+
+# Simple test of the TorpPool functionality
+def test():
+    """Test for TorpPool Class"""
+    from space_bots.headless_engine_adapter import HeadlessEngineAdapter
+    from space_bots.ships.tank import Tank
+    from space_bots.ships.ship import Ship
+
+    # A Tank gives the torps an origin ship (and a zerg ship to shoot at)
+    engine = HeadlessEngineAdapter(None)
+    tank = Tank(engine, 400, 400)
+    zerg = Ship(engine, 800, 400, ship_type='zergling')
+    pool = TorpPool()
+    live = pool.live_torps()
+
+    # Acquire and launch some torps
+    torps = [pool.acquire(tank, level=2, offset_x=10.0 * n) for n in range(4)]
+    for torp in torps[:3]:
+        pool.launch(torp, zerg)
+    assert list(live) == torps[:3]
+    assert pool.num_allocated == 4
+
+    # Staged torps ride along with the tank, launched torps count up
+    tank.x = 300
+    pool.update(tank.world)
+    assert (torps[3].x, torps[3].y) == (330, 400)
+    assert pool.release_counter(torps[0]) == 1
+
+    # Recycled torps come back reset (and the live view updates without being rebuilt)
+    torps[1].force_x = 50
+    pool.recycle(torps[1])
+    assert list(live) == [torps[0], torps[2]]
+    assert torps[1].release_counter == 1
+    tank.x, tank.y = 100, 200
+    recycled = pool.acquire(tank, level=3)
+    assert recycled is torps[1]
+    assert not recycled.released and not recycled.delete_me and recycled.release_counter == 0
+    assert (recycled.x, recycled.y, recycled.force_x, recycled.damage) == (100, 200, 0, 30)
+    assert pool.num_allocated == 4 and pool.num_free() == 0
+
+    # Guidance kicks in after the delay and torps expire after they've been flying for a while
+    pool.launch(recycled, zerg)
+    for _ in range(TorpPool.guidance_delay):
+        pool.update(tank.world)
+        tank.world.integrate()
+    force_x = torps[0].force_x
+    pool.update(tank.world)
+    tank.world.integrate()
+    assert torps[0].force_x == force_x + 1.0  # Zerg is straight along +x
+    (_, prev_x, _, current_x, _), = [sweep for sweep in pool.live_sweeps(tank.world) if sweep[0] is torps[0]]
+    assert prev_x < current_x  # Path from before the integrate step to after
+    # Note: torps[0] was released one tick before the recycled torp
+    while pool.release_counter(recycled) < torps[0].expire:
+        pool.update(tank.world)
+        tank.world.integrate()
+    assert torps[0].delete_me and not recycled.delete_me
+    swept = [sweep[0] for sweep in pool.live_sweeps(tank.world)]
+    assert torps[0] in live and torps[0] not in swept and recycled in swept  # Expired torps can't hit anything
+
+
+if __name__ == "__main__":
+    test()
@@ -31,6 +31,14 @@ class Weapon(ABC):
         """
         pass
 
+    def set_pool(self, pool):
+        """Weapons with ammo (e.g. Torp Launchers) draw it from a shared pool, the rest just ignore it"""
+        pass
+
+    def pre_delete(self):
+        """The ship is going away, weapons might need to give stuff back (e.g. Torps to the pool)"""
+        pass
+
 
 class NoWeapon(Weapon):
     """NoWeapon: Place a NoWeapon into a Ship Weapon Slot for Placeholder"""
@@ -82,11 +90,15 @@ def test():
     my_ship = Fighter(my_game_engine, 300, 500)
     my_universe.add_ship(my_ship, team='earth')
 
-    # Create a Zerg Ship
-    zerg = Ship(my_game_engine, 700, 500, ship_type='mega_bug')
+    # Create a Zerg Ship, hacked so it doesn't do any targeting (ships are slotted, so hack the class)
+    class NoTargetingShip(Ship):
+        __slots__ = ()
+
+        def general_targeting(self):
+            pass
+
+    zerg = NoTargetingShip(my_game_engine, 700, 500, ship_type='mega_bug')
     my_universe.add_ship(zerg, team='zerg')
-    # Hack the zerg ship (no targeting)
-    zerg.general_targeting = lambda: None
     zerg.force_x = -5000
     zerg.force_y = -5000
 
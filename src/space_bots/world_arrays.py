@@ -0,0 +1,160 @@
+"""WorldArrays: Structure-of-Arrays store for the positions, forces, and mass of ALL space_bot Entities"""
+import math
+from array import array
+
+# Local Imports
+from space_bots.utils.lazy_import import lazy_import
+
+# NumPy is optional (imported on first use), if it's not installed we integrate one entity at a time
+np = lazy_import('numpy')
+
+
+class WorldArrays:
+    """WorldArrays: Structure-of-Arrays store for the positions, forces, and mass of ALL space_bot Entities
+       Usage:
+            world = WorldArrays()
+            index = world.allocate()   # Get a slot for a new entity (Entity does this for you)
+            world.x[index] = 500       # Each field is a contiguous float64 array
+            world.queue_move(index)    # Entity.move() queues the entity for the next integrate step
+            world.integrate()          # Integrate/clamp/damp ALL the queued entities in one vectorized step
+            world.free(index)          # Give the slot back when the entity goes away
+    """
+    fields = ('x', 'y', 'force_x', 'force_y', 'mass', 'force_damp', 'speed')
+
+    def __init__(self):
+        """WorldArrays Initialization"""
+        self.x = array('d')
+        self.y = array('d')
+        self.force_x = array('d')
+        self.force_y = array('d')
+        self.mass = array('d')
+        self.force_damp = array('d')
+        self.speed = array('d')  # Speed limit (math.inf for no limit)
+        self._free_slots = []
+        self._moves = []
+
+    def __len__(self):
+        """Number of slots (active and free) in the store"""
+        return len(self.x)
+
+    def allocate(self):
+        """Allocate a slot for a new entity and return its index"""
+        if self._free_slots:
+            return self._free_slots.pop()
+        for field in self.fields:
+            getattr(self, field).append(0.0)
+        return len(self.x) - 1
+
+    def free(self, index):
+        """Give an entity slot back to the store so it can be reused"""
+        self.force_x[index] = 0.0
+        self.force_y[index] = 0.0
+        self._free_slots.append(index)
+
+    def num_active(self):
+        """Number of slots currently in use"""
+        return len(self.x) - len(self._free_slots)
+
+    def numpy_views(self):
+        """Zero-copy NumPy views of each field (don't hold on to these, the store can't grow while they exist)"""
+        return {field: np.frombuffer(getattr(self, field), dtype=np.float64) for field in self.fields}
+
+    def queue_move(self, index):
+        """Queue this entity to be moved on the next integrate step"""
+        self._moves.append(index)
+
+    def queue_moves(self, indices):
+        """Queue a batch of entities to be moved on the next integrate step"""
+        self._moves.extend(indices)
+
+    def integrate(self):
+        """Move all the queued entities based on their current forces, mass, and speed limits and then damp the forces"""
+        if not self._moves:
+            return
+        moves, self._moves = self._moves, []
+        if np is None:
+            self._integrate_python(moves)
+            return
+
+        # One vectorized integrate-damp-clamp step for all the moving entities
+        view = self.numpy_views()
+        indices = np.unique(np.array(moves, dtype=np.intp))
+        speed = view['speed'][indices]
+        view['x'][indices] += np.clip(view['force_x'][indices] / view['mass'][indices], -speed, speed)
+        view['y'][indices] += np.clip(view['force_y'][indices] / view['mass'][indices], -speed, speed)
+        view['force_x'][indices] *= view['force_damp'][indices]
+        view['force_y'][indices] *= view['force_damp'][indices]
+
+    def _integrate_python(self, moves):
+        """Internal: Pure-Python version of the integrate step"""
+        x, y, force_x, force_y = self.x, self.y, self.force_x, self.force_y
+        for index in set(moves):
+            limit = self.speed[index]
+            delta_x = force_x[index] / self.mass[index]
+            delta_y = force_y[index] / self.mass[index]
+            x[index] += max(min(delta_x, limit), -limit)
+            y[index] += max(min(delta_y, limit), -limit)
+            force_x[index] *= self.force_damp[index]
+            force_y[index] *= self.force_damp[index]
+
+
+# Process-level default store (each Entity gets a slot here unless given a store)
+_default_world = None
+
+
+def default_world():
+    """The default WorldArrays store shared by all Entities"""
+    global _default_world
+    if _default_world is None:
+        _default_world = WorldArrays()
+    return _default_world
+
+
+# Simple test of the WorldArrays functionality
+def test():
+    """Test for WorldArrays Class"""
+    from space_bots.utils import force_utils
+
+    class FakeEntity:
+        def __init__(self, x, y, force_x, force_y, mass, speed=None):
+            self.x = x
+            self.y = y
+            self.force_x = force_x
+            self.force_y = force_y
+            self.mass = mass
+            self.speed = speed
+
+    # Create some entities in the world arrays and (in parallel) as plain objects
+    world = WorldArrays()
+    entities = []
+    for n in range(50):
+        entity = FakeEntity(n * 10.0, n * 5.0, n * 3.0 - 70, 100.0 - n * 4.0, 10.0 + n, speed=None if n % 2 else 0.5)
+        index = world.allocate()
+        world.x[index], world.y[index] = entity.x, entity.y
+        world.force_x[index], world.force_y[index] = entity.force_x, entity.force_y
+        world.mass[index] = entity.mass
+        world.force_damp[index] = 0.99
+        world.speed[index] = math.inf if entity.speed is None else entity.speed
+        world.queue_move(index)
+        entities.append(entity)
+
+    # The vectorized integrate should match the scalar force_based_movement (plus damping)
+    world.integrate()
+    for index, entity in enumerate(entities):
+        force_utils.force_based_movement(entity, entity.speed)
+        assert world.x[index] == entity.x and world.y[index] == entity.y
+        assert world.force_x[index] == entity.force_x * 0.99
+        assert world.force_y[index] == entity.force_y * 0.99
+
+    # Nothing queued so nothing should move
+    world.integrate()
+    assert world.x[1] == entities[1].x
+
+    # Freed slots get reused
+    world.free(3)
+    assert world.allocate() == 3
+    assert world.num_active() == len(entities)
+
+
+if __name__ == "__main__":
+    test()